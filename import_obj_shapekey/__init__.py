@@ -0,0 +1,21 @@
+bl_info = {
+    "name": "OBJ Shape Keys",
+    "description": "Import a sequence of OBJ (or STL, PLY) files and convert them to an animation using shape keys.",
+    "author": "Alex Dahl",
+    "version": (1, 1, 0),
+    "blender": (3, 2, 0),
+    "location": "File > Import > OBJ Shape Keys",
+    "category": "Import",
+#    "doc_url": "",
+#    "tracker_url": "",
+    "warning": ""
+}
+
+try:
+    import bpy
+except ImportError:
+    #the bpy-free modules (meshio, pipeline) also get imported by worker processes outside of Blender
+    bpy = None
+
+if bpy is not None:
+    from .shapekeys import register, unregister
@@ -0,0 +1,212 @@
+import os
+import sys
+import json
+import time
+import argparse
+
+#Headless batch conversion of sequences, never touches the UI code paths.
+#   blender -b -P import_obj_shapekey/batch.py -- jobs.json [--report report.json]
+#   python -m import_obj_shapekey.batch jobs.json [--report report.json]
+#The jobs file holds a list of jobs, or {"jobs": [...], "workers": N, "maxInFlight": N, "memoryBudget": MB}. A job looks like
+#   {"directory": "/sims/cloth", "prefix": "cloth_", "format": "obj", "output": "/out/cloth.blend",
+#    "settings": {"obj_global_scale": 0.01, "axis_forward": "-Z", "axis_up": "Y"},
+#    "storage": "KEYS", "staticThreshold": 1e-6, "reduceTolerance": 0.0, "reduceMode": "HOLD", "topology": "ABORT"}
+#"settings" are MeshImporter properties. Outputs ending in .blend are imported like the import operator does
+#and saved (needs Blender). Outputs ending in .pc2 or .mdd get every frame, including the first, written to a
+#point cache ("fps" sets the MDD frame times), which also works without Blender. The positions are converted
+#with the axes and scale of the settings (MeshImporter defaults for the ones left out), so the cache fits a
+#mesh imported with the same settings. Settings that need Blender (scene units, clamping) are rejected there.
+
+if __package__ in (None, ''):
+    #run as a script with blender -P
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'import_obj_shapekey'
+    import import_obj_shapekey
+
+from . import meshio
+from . import pipeline
+from .scan import findSequenceFiles
+from . import pointcache
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+
+class JobError(Exception):
+    pass
+
+
+#MeshImporter settings a point cache output understands, with their defaults. The ones that only change
+#what the importer makes besides the positions are accepted and ignored
+POINT_CACHE_SETTINGS = {
+    'obj_global_scale': 1.0,
+    'obj_global_clamp_size': 0.0,
+    'obj_use_split_objects': True,
+    'obj_use_split_groups': False,
+    'obj_use_groups_as_vgroups': False,
+    'stl_global_scale': 1.0,
+    'stl_use_scene_unit': False,
+    'stl_use_facet_normal': False,
+    'ply_global_scale': 1.0,
+    'ply_use_scene_unit': False,
+    'axis_forward': 'NEGATIVE_Z',
+    'axis_up': 'Y',
+}
+
+
+def readAheadLimits(base, firstFile, numWorkers, maxInFlight, memoryBudget):
+    """ numWorkers and maxInFlight lowered to fit the memory budget (MB), see pipeline.budgetInFlight
+    """
+    return pipeline.budgetInFlight(memoryBudget*1024*1024, 4*len(base) + os.path.getsize(firstFile), numWorkers, maxInFlight)
+
+def pointCacheSettings(job):
+    """ The job's importer settings with the defaults filled in. Raises JobError for settings that
+        can't be applied without Blender
+    """
+    settings = dict(POINT_CACHE_SETTINGS)
+    for name, value in job.get('settings', {}).items():
+        if name not in settings:
+            raise JobError("Setting %s isn't supported for point cache outputs" % name)
+        settings[name] = value
+    if settings['stl_use_scene_unit'] or settings['ply_use_scene_unit']:
+        raise JobError("Scene units need Blender, use a .blend output or set the scale instead")
+    if settings['obj_global_clamp_size'] > 0.0:
+        raise JobError("Clamping depends on the bounds of each frame, use a .blend output")
+    return settings
+
+def convertToPointCache(job, numWorkers, maxInFlight, memoryBudget=0):
+    """ Write every frame of a sequence to a PC2 or MDD file, one frame in memory at a time.
+        Returns (files, vertices, frames)
+    """
+    fileExt = job['format']
+    files = findSequenceFiles(job['directory'], job.get('prefix', ''), fileExt)
+    if len(files) == 0:
+        raise JobError("No matching files found")
+    runs = pipeline.topologyRuns(pipeline.readVertexCounts(fileExt, files, numWorkers))
+    if len(runs) > 1:
+        raise JobError("The vertex number changes at %s, point caches need the same topology in every frame" % files[runs[1][0]])
+    settings = pointCacheSettings(job)
+    try:
+        #the same conversion the importer applies
+        matrix = meshio.axisConversion(settings['axis_forward'], settings['axis_up'], settings.get(fileExt+'_global_scale', 1.0))
+    except (KeyError, ValueError):
+        raise JobError("Invalid axes %s and %s" % (settings['axis_forward'], settings['axis_up']))
+    if fileExt == 'obj' and (settings['obj_use_split_objects'] or settings['obj_use_split_groups']):
+        if len(meshio.readOBJObjects(files[0], settings['obj_use_split_groups'])) > 1:
+            raise JobError("%s has several objects, point caches hold a single mesh" % files[0])
+    base = meshio.readPositions(fileExt, files[0], matrix)
+    if base is None:
+        raise JobError("%s can't be read without Blender's importer" % files[0])
+    numWorkers, maxInFlight = readAheadLimits(base, files[0], numWorkers, maxInFlight, memoryBudget)
+    def frames():
+        yield base
+        for f, coords in pipeline.readFrames(fileExt, files[1:], matrix, numWorkers, maxInFlight):
+            if coords is None or len(coords) != len(base):
+                raise JobError("%s can't be read or has a different vertex number than the first file" % f)
+            yield coords
+    pointcache.writePointCache(job['output'], frames(), len(base)//3, len(files), fps=job.get('fps', 24.0))
+    return (len(files), len(base)//3, len(files))
+
+def convertToBlend(job):
+    """ Import a sequence into an empty scene and save it. Returns (files, vertices, frames)
+    """
+    from bpy_extras.io_utils import axis_conversion
+    from .shapekeys import loadSequence
+    bpy.ops.wm.read_homefile(use_empty=True)
+    fileImporter = bpy.context.window_manager.objsk_import_settings
+    for name, value in job.get('settings', {}).items():
+        setattr(fileImporter, name, value)
+    meshCount, seqObjs = loadSequence(job['directory'], job.get('prefix', ''), job['format'], fileImporter,
+                                      storageMode=job.get('storage', 'KEYS'), staticThreshold=job.get('staticThreshold', 1e-6),
+                                      reduceTolerance=job.get('reduceTolerance', 0.0), reduceMode=job.get('reduceMode', 'HOLD'),
+                                      topologyMode=job.get('topology', 'ABORT'))
+    if meshCount == 0:
+        raise JobError("No matching files found")
+    if meshCount < 0:
+        raise JobError(seqObjs)
+    forward = fileImporter.axis_forward.replace('NEGATIVE_', '-')
+    up = fileImporter.axis_up.replace('NEGATIVE_', '-')
+    global_matrix = axis_conversion(from_forward=forward, from_up=up).to_4x4()
+    for seqObj in seqObjs:
+        seqObj.matrix_world = global_matrix
+        meshName = os.path.splitext(seqObj.name)[0].rstrip('._0123456789')
+        seqObj.name = meshName + '_shapekeys'
+    bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(job['output']))
+    settings = seqObjs[0].objsk_settings
+    return (settings.numMeshes, sum(len(obj.data.vertices) for obj in seqObjs), meshCount)
+
+def runJob(job, numWorkers, maxInFlight, memoryBudget=0):
+    report = {
+        'directory': job.get('directory'),
+        'prefix': job.get('prefix', ''),
+        'format': job.get('format'),
+        'output': job.get('output'),
+        'files': 0,
+        'vertices': 0,
+        'frames': 0,
+        'seconds': 0.0,
+        'error': None,
+    }
+    start = time.perf_counter()
+    try:
+        if os.path.splitext(job['output'])[1][1:].lower() in pointcache.FORMATS:
+            result = convertToPointCache(job, numWorkers, maxInFlight, memoryBudget)
+        elif job['output'].endswith('.blend'):
+            if bpy is None:
+                raise JobError(".blend outputs need to run inside Blender (blender -b -P batch.py -- jobs.json)")
+            result = convertToBlend(job)
+        else:
+            raise JobError("Output has to be a .blend, .pc2 or .mdd file")
+        report['files'], report['vertices'], report['frames'] = result
+    except JobError as e:
+        report['error'] = str(e)
+    except Exception as e:
+        #anything else (a broken worker pool, an operator failing inside Blender) only fails this job
+        report['error'] = '%s: %s' % (type(e).__name__, e)
+    report['seconds'] = time.perf_counter() - start
+    return report
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog='batch', description="Convert mesh sequences to shape key .blend files or point caches")
+    parser.add_argument('jobs', help="JSON file with the jobs to run")
+    parser.add_argument('--report', help="Write the per job report to this JSON file")
+    parser.add_argument('--workers', type=int, help="Parser processes (zero for all but one core)")
+    parser.add_argument('--max-in-flight', type=int, help="Maximum number of frames read ahead")
+    parser.add_argument('--memory-budget', type=int, help="MB the frames read ahead may take, lowers the frames in flight (zero for no limit)")
+    args = parser.parse_args(argv)
+    with open(args.jobs) as f:
+        config = json.load(f)
+    if isinstance(config, list):
+        config = {'jobs': config}
+    numWorkers = args.workers if args.workers is not None else config.get('workers', 0)
+    maxInFlight = args.max_in_flight if args.max_in_flight is not None else config.get('maxInFlight', 0)
+    memoryBudget = args.memory_budget if args.memory_budget is not None else config.get('memoryBudget', 0)
+
+    if bpy is not None:
+        import addon_utils
+        if not hasattr(bpy.types.Object, 'objsk_settings'):
+            addon_utils.enable(__package__, default_set=True)
+        from .shapekeys import getPreferences
+        getPreferences().numWorkers = numWorkers
+        getPreferences().maxInFlight = maxInFlight
+        getPreferences().memoryBudget = memoryBudget
+
+    reports = []
+    for job in config['jobs']:
+        report = runJob(job, numWorkers, maxInFlight, memoryBudget)
+        reports.append(report)
+        print(json.dumps(report))
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(reports, f, indent=2)
+    return 0 if all(r['error'] is None for r in reports) else 1
+
+
+if __name__ == '__main__':
+    argv = sys.argv[1:]
+    if '--' in argv:
+        #blender -b -P batch.py -- jobs.json
+        argv = argv[argv.index('--')+1:]
+    sys.exit(main(argv))
@@ -0,0 +1,236 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from contextlib import contextmanager
+import numpy as np
+
+#Benchmarks for sequence import and playback on synthetic sequences.
+#   python -m import_obj_shapekey.benchmark --verts 1000 100000 --frames 10 100 --output results.json
+#   blender -b -P import_obj_shapekey/benchmark.py -- --verts 1000 100000 --frames 10 100 --output results.json
+#Without Blender only the phases that don't need it are timed (scan, parse, transfer into a float32 buffer).
+#Inside Blender a full import through loadSequence (with its per-phase timings), the regular importer per frame
+#and playback are timed as well.
+#Results are written as JSON so they can be compared between runs.
+
+if __package__ in (None, ''):
+    #run as a script with blender -P
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'import_obj_shapekey'
+    import import_obj_shapekey
+
+from . import meshio
+from . import pipeline
+from .scan import findSequenceFiles
+from .stats import ImportStats
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+#benchmark format name -> (file extension, writer)
+FORMATS = {}
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def gridMesh(numVerts):
+    """ Flat grid with numVerts vertices (as (n, 3) float32) and the triangles of every complete quad
+    """
+    width = max(2, int(np.ceil(np.sqrt(numVerts))))
+    index = np.arange(numVerts)
+    coords = np.zeros((numVerts, 3), dtype=np.float32)
+    coords[:, 0] = index % width
+    coords[:, 1] = index // width
+    corners = index[(index % width < width-1) & (index+width+1 < numVerts)]
+    tris = np.concatenate([np.stack([corners, corners+1, corners+width+1], axis=1),
+                           np.stack([corners, corners+width+1, corners+width], axis=1)])
+    return coords/width, tris
+
+def frameCoords(base, frame):
+    """ Base grid displaced by a travelling wave, so every frame is different
+    """
+    coords = base.copy()
+    coords[:, 2] = 0.1*np.sin(10.0*coords[:, 0] + 0.1*frame)
+    return coords
+
+def writeOBJ(path, coords, tris):
+    with open(path, 'w') as f:
+        f.write('o Synthetic\n')
+        np.savetxt(f, coords, fmt='v %.6f %.6f %.6f')
+        np.savetxt(f, tris+1, fmt='f %d %d %d')
+
+def plyHeader(fmt, coords, tris):
+    return ("ply\nformat %s 1.0\nelement vertex %d\nproperty float x\nproperty float y\nproperty float z\n"
+            "element face %d\nproperty list uchar int vertex_indices\nend_header\n" % (fmt, len(coords), len(tris))).encode('ascii')
+
+def writePLYAscii(path, coords, tris):
+    with open(path, 'wb') as f:
+        f.write(plyHeader('ascii', coords, tris))
+        np.savetxt(f, coords, fmt='%.6f %.6f %.6f')
+        np.savetxt(f, tris, fmt='3 %d %d %d')
+
+def writePLYBinary(path, coords, tris):
+    faces = np.zeros(len(tris), dtype=[('n', 'u1'), ('v', '<i4', 3)])
+    faces['n'] = 3
+    faces['v'] = tris
+    with open(path, 'wb') as f:
+        f.write(plyHeader('binary_little_endian', coords, tris))
+        f.write(coords.astype('<f4').tobytes())
+        f.write(faces.tobytes())
+
+def writeSTLBinary(path, coords, tris):
+    records = np.zeros(len(tris), dtype=[('normal', '<f4', 3), ('v', '<f4', (3, 3)), ('attr', '<u2')])
+    records['v'] = coords[tris]
+    with open(path, 'wb') as f:
+        f.write(b'\0'*80)
+        f.write(np.uint32(len(tris)).astype('<u4').tobytes())
+        f.write(records.tobytes())
+
+FORMATS['obj'] = ('obj', writeOBJ)
+FORMATS['ply_ascii'] = ('ply', writePLYAscii)
+FORMATS['ply_binary'] = ('ply', writePLYBinary)
+FORMATS['stl'] = ('stl', writeSTLBinary)
+
+def generateSequence(directory, formatName, numVerts, numFrames, prefix='frame_'):
+    """ Write a synthetic sequence, returns the file extension
+    """
+    fileExt, writer = FORMATS[formatName]
+    base, tris = gridMesh(numVerts)
+    for frame in range(numFrames):
+        writer(os.path.join(directory, '%s%05d.%s' % (prefix, frame+1, fileExt)), frameCoords(base, frame), tris)
+    return fileExt
+
+def benchmarkParsing(timer, directory, fileExt, numWorkers, prefix='frame_'):
+    """ Phases that don't need Blender. Returns the number of vertices per frame
+    """
+    with timer.phase('scan'):
+        files = findSequenceFiles(directory, prefix, fileExt)
+    numVerts = 0
+    buffer = None
+    #one frame at a time, like an import, so memory doesn't grow with the sequence
+    for f in files:
+        with timer.phase('parse'):
+            coords = meshio.readPositions(fileExt, f)
+        #stand-in for foreach_set: one bulk copy per frame into a preallocated float32 buffer
+        with timer.phase('transfer'):
+            if buffer is None or len(buffer) != len(coords):
+                buffer = np.empty(len(coords), dtype=np.float32)
+            buffer[:] = np.frombuffer(coords, dtype=np.float32)
+            numVerts = len(coords)//3
+    with timer.phase('parse_parallel'):
+        for f, coords in pipeline.readFrames(fileExt, files, None, numWorkers):
+            pass
+    return numVerts
+
+def benchmarkBlender(timer, directory, fileExt, prefix='frame_'):
+    """ Phases inside Blender, on an empty scene. The import itself goes through loadSequence,
+        its own phase timings are added with an 'import_' prefix
+    """
+    from .shapekeys import deselectAll, loadSequence
+    bpy.ops.wm.read_homefile(use_empty=True)
+    fileImporter = bpy.context.window_manager.objsk_import_settings
+    files = findSequenceFiles(directory, prefix, fileExt)
+    stats = ImportStats()
+    with timer.phase('import'):
+        meshCount, seqObjs = loadSequence(directory, prefix, fileExt, fileImporter, stats=stats)
+    if meshCount <= 0:
+        raise RuntimeError(seqObjs if meshCount < 0 else "No matching files found")
+    for name, seconds in stats.phases.items():
+        timer.phases['import_'+name] = seconds
+    with timer.phase('importer_per_frame'):
+        for f in files[1:]:
+            deselectAll()
+            fileImporter.load(fileExt, f)
+            bpy.ops.object.delete()
+    scene = bpy.context.scene
+    with timer.phase('playback'):
+        for frame in range(1, len(files)+1):
+            scene.frame_set(frame)
+    return stats.summary()
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog='benchmark', description="Time sequence import phases on synthetic sequences")
+    parser.add_argument('--verts', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--frames', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--formats', nargs='+', choices=sorted(FORMATS), default=sorted(FORMATS))
+    parser.add_argument('--workers', type=int, default=0, help="Parser processes for the parallel parse phase (zero for all but one core)")
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    parser.add_argument('--keep', help="Generate the sequences in this folder and keep them")
+    args = parser.parse_args(argv)
+
+    if bpy is not None:
+        import addon_utils
+        if not hasattr(bpy.types.Object, 'objsk_settings'):
+            addon_utils.enable(__package__, default_set=True)
+
+    results = []
+    for formatName in args.formats:
+        for numVerts in args.verts:
+            for numFrames in args.frames:
+                directory = args.keep or tempfile.mkdtemp(prefix='objsk_bench_')
+                directory = os.path.join(directory, '%s_%d_%d' % (formatName, numVerts, numFrames))
+                os.makedirs(directory, exist_ok=True)
+                timer = PhaseTimer()
+                with timer.phase('generate'):
+                    fileExt = generateSequence(directory, formatName, numVerts, numFrames)
+                parsedVerts = benchmarkParsing(timer, directory, fileExt, args.workers)
+                importSummary = None
+                error = None
+                if bpy is not None:
+                    try:
+                        importSummary = benchmarkBlender(timer, directory, fileExt)
+                    except RuntimeError as e:
+                        #a failed import isn't a timing
+                        error = str(e)
+                if not args.keep:
+                    shutil.rmtree(os.path.dirname(directory), ignore_errors=True)
+                result = {
+                    'format': formatName,
+                    'verts': parsedVerts,
+                    'frames': numFrames,
+                    'bytes_per_frame': 12*parsedVerts,
+                    'phases': timer.phases,
+                    'error': error,
+                }
+                if importSummary is not None:
+                    result['peak_memory'] = importSummary['peakMemory']
+                    result['frames_per_second'] = importSummary['framesPerSecond']
+                results.append(result)
+                print(json.dumps(result))
+    report = {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'blender': bpy.app.version_string if bpy is not None else None,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    argv = sys.argv[1:]
+    if '--' in argv:
+        #blender -b -P benchmark.py -- --verts 1000
+        argv = argv[argv.index('--')+1:]
+    sys.exit(main(argv))
@@ -0,0 +1,127 @@
+import os
+import hashlib
+from array import array
+
+#Persistent on-disk cache of parsed frame positions.
+#Every frame is stored as one raw float32 file named after a hash of the source file's absolute path,
+#size, mtime and the import settings that change the positions, so an edited file or different settings
+#never hit a stale entry. The entry's mtime is touched on every hit and the least recently used entries
+#are removed once the cache grows past its size limit, down to a fraction of it so the folder isn't
+#rescanned for every frame added after that. Parser processes write entries themselves (write), only the
+#process that owns the cache keeps track of its size (added).
+
+ENTRY_EXT = '.f32'
+#eviction goes down to this fraction of the size limit
+LOW_WATER = 0.8
+
+
+class FrameCache:
+    def __init__(self, directory, maxBytes):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self.size = None
+
+    def entryPath(self, filePath, signature):
+        try:
+            st = os.stat(filePath)
+        except OSError:
+            return None
+        key = '%s\0%d\0%d\0%s' % (os.path.abspath(filePath), st.st_size, st.st_mtime_ns, signature)
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + ENTRY_EXT)
+
+    def get(self, filePath, signature):
+        """ Positions of a file if they're in the cache, otherwise None
+        """
+        path = self.entryPath(filePath, signature)
+        if path is None or not os.path.isfile(path):
+            return None
+        coords = array('f')
+        try:
+            with open(path, 'rb') as f:
+                coords.frombytes(f.read())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return coords
+
+    def write(self, filePath, signature, coords):
+        """ Store the positions of a file without updating the size, returns the entry's path or None
+            if it couldn't be written
+        """
+        path = self.entryPath(filePath, signature)
+        if path is None:
+            return None
+        #write to a temp name first so other processes never see a partial entry
+        tempPath = path + '.%d.tmp' % os.getpid()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tempPath, 'wb') as f:
+                coords.tofile(f)
+            os.replace(tempPath, path)
+        except OSError:
+            try:
+                os.remove(tempPath)
+            except OSError:
+                pass
+            return None
+        return path
+
+    def put(self, filePath, signature, coords):
+        if self.write(filePath, signature, coords) is not None:
+            self.added(4*len(coords))
+
+    def added(self, numBytes):
+        """ Count an entry written with write, evicts once the cache is over its limit
+        """
+        if self.size is None:
+            self.size = self.totalSize()
+        else:
+            self.size += numBytes
+        if self.size > self.maxBytes:
+            self.evict()
+
+    def entries(self):
+        """ (mtime, size, path) for every entry in the cache
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        result = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(ENTRY_EXT) and entry.is_file():
+                    st = entry.stat()
+                    result.append((st.st_mtime, st.st_size, entry.path))
+        return result
+
+    def totalSize(self):
+        return sum(e[1] for e in self.entries())
+
+    def evict(self):
+        """ Remove least recently used entries until the cache is back under LOW_WATER of its size limit
+        """
+        try:
+            entries = sorted(self.entries())
+        except OSError:
+            return
+        self.size = sum(e[1] for e in entries)
+        for mtime, size, path in entries:
+            if self.size <= LOW_WATER*self.maxBytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= size
+
+    def clear(self):
+        """ Remove every entry, returns the number of bytes freed
+        """
+        freed = 0
+        for mtime, size, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            freed += size
+        self.size = 0
+        return freed
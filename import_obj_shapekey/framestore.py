@@ -0,0 +1,114 @@
+import os
+import struct
+import numpy as np
+
+#Packed frame store, used instead of one shape key per frame.
+#Layout (little endian):
+#   header: magic, version, flags, number of vertices, number of frames, number of stored vertices
+#   uint32 index of every stored vertex (only if fewer vertices are stored than the mesh has)
+#   float32 xyz of every stored vertex, frame after frame
+#With FLAG_DELTA the values are offsets from the base mesh, vertices that aren't stored never move.
+#Without it every vertex is stored with its absolute position, so a frame can be used straight from the file.
+
+MAGIC = b'OBJSKFS\0'
+VERSION = 1
+HEADER = struct.Struct('<8s5I')
+FLAG_DELTA = 1
+
+
+class FrameStoreWriter:
+    """ Writes a sequence to a frame store one frame at a time, so only one frame is held in memory.
+        With sparse set, frames are stored as deltas from the base and vertices that never move further than
+        threshold are left out. That needs a second pass over the data, so the deltas go to a temp file first.
+        Otherwise the absolute positions of every vertex are written as they come
+    """
+    def __init__(self, path, baseCoords, threshold=0.0, sparse=True):
+        self.path = path
+        self.base = np.array(baseCoords, dtype=np.float32).reshape(-1, 3)
+        self.threshold = threshold
+        self.sparse = sparse
+        self.numFrames = 0
+        self.moving = np.zeros(len(self.base), dtype=bool)
+        self.tempPath = path + '.tmp'
+        self.temp = open(self.tempPath, 'wb')
+        if not sparse:
+            #header gets filled in once the number of frames is known
+            self.temp.write(HEADER.pack(MAGIC, VERSION, 0, len(self.base), 0, len(self.base)))
+
+    def add(self, coords):
+        frame = np.frombuffer(coords, dtype=np.float32).reshape(-1, 3)
+        if not self.sparse:
+            self.temp.write(frame.astype('<f4').tobytes())
+            self.numFrames += 1
+            return
+        delta = frame - self.base
+        self.moving |= np.abs(delta).max(axis=1) > self.threshold
+        self.temp.write(delta.astype('<f4').tobytes())
+        self.numFrames += 1
+
+    def close(self):
+        """ Finish the file, returns the number of stored vertices
+        """
+        if not self.sparse:
+            self.temp.seek(0)
+            self.temp.write(HEADER.pack(MAGIC, VERSION, 0, len(self.base), self.numFrames, len(self.base)))
+            self.temp.close()
+            os.replace(self.tempPath, self.path)
+            return len(self.base)
+        self.temp.close()
+        indices = np.flatnonzero(self.moving).astype('<u4')
+        frameSize = 12*len(self.base)
+        with open(self.tempPath, 'rb') as src, open(self.path, 'wb') as dst:
+            dst.write(HEADER.pack(MAGIC, VERSION, FLAG_DELTA, len(self.base), self.numFrames, len(indices)))
+            if len(indices) != len(self.base):
+                dst.write(indices.tobytes())
+            for i in range(self.numFrames):
+                delta = np.frombuffer(src.read(frameSize), dtype='<f4').reshape(-1, 3)
+                dst.write(delta[indices].tobytes())
+        os.remove(self.tempPath)
+        return len(indices)
+
+    def abort(self):
+        self.temp.close()
+        if os.path.exists(self.tempPath):
+            os.remove(self.tempPath)
+
+
+class FrameStore:
+    """ Read access to a frame store, memory-mapped so frames are only loaded when they're used
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, version, self.flags, self.numVerts, self.numFrames, self.numStored = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("%s is not a frame store" % path)
+        if self.numStored == 0 or self.numFrames == 0:
+            #nothing moves, mmap can't map empty ranges
+            self.indices = np.zeros(0, dtype='<u4')
+            self.data = np.zeros((self.numFrames, 0, 3), dtype='<f4')
+            return
+        offset = HEADER.size
+        self.indices = None
+        if self.numStored != self.numVerts:
+            self.indices = np.memmap(path, dtype='<u4', mode='r', offset=offset, shape=(self.numStored,))
+            offset += 4*self.numStored
+        self.data = np.memmap(path, dtype='<f4', mode='r', offset=offset, shape=(self.numFrames, self.numStored, 3))
+
+    def positions(self, index, base):
+        """ Flat float32 positions of stored frame index, base is the (vertices, 3) base mesh positions
+        """
+        if not self.flags & FLAG_DELTA:
+            #absolute positions of every vertex, a view straight into the mapped file
+            return self.data[index].reshape(-1)
+        coords = base.copy()
+        if self.indices is None:
+            coords += self.data[index]
+        else:
+            coords[self.indices] += self.data[index]
+        return coords.ravel()
+
+    def close(self):
+        #drop the maps, the file is closed once the last view into it is gone
+        self.indices = None
+        self.data = None
@@ -0,0 +1,507 @@
+import os
+import re
+import struct
+import sys
+from array import array
+
+#Positions-only readers for the sequence formats.
+#These don't depend on bpy so they can also be used outside of Blender.
+#Every reader returns a flat float32 array [x0, y0, z0, x1, y1, z1, ...] in file order,
+#or None if the file uses a variant that isn't supported here and has to go through the regular importer.
+#readMesh also reads the faces, for sequences whose topology changes every frame.
+
+AXES = {
+    'X': (1.0, 0.0, 0.0),
+    'Y': (0.0, 1.0, 0.0),
+    'Z': (0.0, 0.0, 1.0),
+    '-X': (-1.0, 0.0, 0.0),
+    '-Y': (0.0, -1.0, 0.0),
+    '-Z': (0.0, 0.0, -1.0),
+}
+
+IDENTITY = ((1.0, 0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0, 0.0),
+            (0.0, 0.0, 1.0, 0.0),
+            (0.0, 0.0, 0.0, 1.0))
+
+PLY_TYPES = {
+    'char': 'b', 'int8': 'b',
+    'uchar': 'B', 'uint8': 'B',
+    'short': 'h', 'int16': 'h',
+    'ushort': 'H', 'uint16': 'H',
+    'int': 'i', 'int32': 'i',
+    'uint': 'I', 'uint32': 'I',
+    'float': 'f', 'float32': 'f',
+    'double': 'd', 'float64': 'd',
+}
+
+#per vertex texture coordinates in PLY files, under the names Blender's importer looks for
+PLY_UV_NAMES = (('s', 't'), ('u', 'v'), ('texture_u', 'texture_v'))
+
+
+def axisConversion(forward, up, scale=1.0):
+    """ Matrix converting from the given forward/up axes into Blender's (forward Y, up Z),
+        same as bpy_extras.io_utils.axis_conversion. Axes may be given as '-Z' or 'NEGATIVE_Z'
+    """
+    f = AXES[forward.replace('NEGATIVE_', '-')]
+    u = AXES[up.replace('NEGATIVE_', '-')]
+    if abs(sum(a*b for a, b in zip(f, u))) != 0.0:
+        raise ValueError("Forward and up axis can't be the same axis")
+    right = (f[1]*u[2] - f[2]*u[1], f[2]*u[0] - f[0]*u[2], f[0]*u[1] - f[1]*u[0])
+    return tuple(tuple(c*scale for c in row) + (0.0,) for row in (right, f, u)) + ((0.0, 0.0, 0.0, 1.0),)
+
+def isIdentity(matrix, tolerance=1e-6):
+    return all(abs(a - b) <= tolerance for row, idRow in zip(matrix, IDENTITY) for a, b in zip(row, idRow))
+
+def transformPositions(coords, matrix):
+    """ Apply a 4x4 matrix (as nested rows) to a flat position array in place
+    """
+    if matrix is None or isIdentity(matrix):
+        return coords
+    (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23) = matrix[0], matrix[1], matrix[2]
+    for i in range(0, len(coords), 3):
+        x, y, z = coords[i], coords[i+1], coords[i+2]
+        coords[i] = m00*x + m01*y + m02*z + m03
+        coords[i+1] = m10*x + m11*y + m12*z + m13
+        coords[i+2] = m20*x + m21*y + m22*z + m23
+    return coords
+
+def readPositions(fileType, filePath, matrix=None, objects=None):
+    """ Read only the vertex positions of a mesh file, optionally transformed by a 4x4 matrix.
+        objects is (names, splitGroups) to read several objects out of an OBJ file, their positions
+        are concatenated in the order of names
+    """
+    if objects is not None:
+        if fileType != 'obj':
+            return None
+        matched = matchObjects(objects[0], readOBJObjects(filePath, objects[1]))
+        if matched is None:
+            return None
+        coords = array('f')
+        for c in matched:
+            coords.extend(c)
+        return transformPositions(coords, matrix)
+    if fileType == 'obj':
+        coords = readOBJPositions(filePath)
+    elif fileType == 'stl':
+        coords = readSTLPositions(filePath)
+    elif fileType == 'ply':
+        coords = readPLYPositions(filePath)
+    else:
+        return None
+    if coords is None:
+        return None
+    return transformPositions(coords, matrix)
+
+def readOBJPositions(filePath):
+    coords = array('f')
+    with open(filePath, 'rb') as f:
+        for line in f:
+            if line[:2] == b'v ' or line[:2] == b'v\t':
+                #v x y z [w] [r g b], only the position is needed
+                values = line.split()
+                coords.append(float(values[1]))
+                coords.append(float(values[2]))
+                coords.append(float(values[3]))
+    return coords
+
+def readOBJObjects(filePath, splitGroups=False):
+    """ (name, positions) of every object in an OBJ file, split on 'o' lines and also on 'g' lines with
+        splitGroups, like the importer does. Vertices belong to the object they're listed under.
+        Vertices before the first name go into an object named ''
+    """
+    objects = []
+    name = ''
+    coords = array('f')
+    with open(filePath, 'rb') as f:
+        for line in f:
+            if line[:2] == b'v ' or line[:2] == b'v\t':
+                values = line.split()
+                coords.append(float(values[1]))
+                coords.append(float(values[2]))
+                coords.append(float(values[3]))
+            elif line[:2] == b'o ' or (splitGroups and line[:2] == b'g '):
+                if len(coords) > 0:
+                    objects.append((name, coords))
+                    coords = array('f')
+                name = line[2:].strip().decode('utf-8', 'replace')
+    if len(coords) > 0:
+        objects.append((name, coords))
+    return objects
+
+def matchObjects(names, objects):
+    """ Order (name, value) pairs like names, a name that appears more than once is matched in order.
+        Returns the values, or None if one of the names is missing
+    """
+    byName = {}
+    for name, value in objects:
+        byName.setdefault(name, []).append(value)
+    matched = []
+    for name in names:
+        found = byName.get(name)
+        if not found:
+            return None
+        matched.append(found.pop(0))
+    return matched
+
+def readSTLTriangles(filePath):
+    """ The triangle records of a binary STL file, None for ascii STL
+    """
+    with open(filePath, 'rb') as f:
+        header = f.read(84)
+        if len(header) < 84:
+            return None
+        numTris = struct.unpack('<I', header[80:84])[0]
+        if os.fstat(f.fileno()).st_size != 84 + 50*numTris:
+            #ascii stl
+            return None
+        return f.read(50*numTris)
+
+def readSTLPositions(filePath):
+    """ Only binary STL is supported. Blender's importer merges identical vertices in the order
+        they're first used by a triangle, so the same is done here
+    """
+    data = readSTLTriangles(filePath)
+    if data is None:
+        return None
+    index = {}
+    for tri in struct.iter_unpack('<12fH', data):
+        index.setdefault(tri[3:6], None)
+        index.setdefault(tri[6:9], None)
+        index.setdefault(tri[9:12], None)
+    coords = array('f')
+    for v in index:
+        coords.extend(v)
+    return coords
+
+def readVertexCount(fileType, filePath):
+    """ Vertex count of a file without parsing it, only meant to compare the files of one sequence.
+        PLY and STL only read the header (STL gives the triangle count), OBJ counts the 'v' lines.
+        None if it can't be told
+    """
+    if fileType == 'ply':
+        with open(filePath, 'rb') as f:
+            header = readPLYHeader(f)
+        if header is None:
+            return None
+        for name, count, props in header[1]:
+            if name == 'vertex':
+                return count
+        return None
+    if fileType == 'stl':
+        with open(filePath, 'rb') as f:
+            header = f.read(84)
+            if len(header) < 84:
+                return None
+            numTris = struct.unpack('<I', header[80:84])[0]
+            if os.fstat(f.fileno()).st_size != 84 + 50*numTris:
+                return None
+        return numTris
+    if fileType == 'obj':
+        count = 0
+        #the last two bytes of the previous chunk, so lines split between chunks are still counted
+        tail = b'\n'
+        with open(filePath, 'rb') as f:
+            while True:
+                chunk = f.read(1 << 24)
+                if not chunk:
+                    return count
+                data = tail + chunk
+                count += data.count(b'\nv ') + data.count(b'\nv\t')
+                tail = data[-2:]
+    return None
+
+OBJ_MATERIAL_LINE = re.compile(rb'^[ \t]*(?:mtllib|usemtl)\b[^\n]*(?:\n|$)', re.MULTILINE)
+
+def stripOBJMaterials(srcPath, dstPath):
+    """ Copy an OBJ file without its mtllib and usemtl lines, so importing the copy doesn't load any
+        materials or textures. Read in 16 MB chunks
+    """
+    pattern = OBJ_MATERIAL_LINE
+    with open(srcPath, 'rb') as src, open(dstPath, 'wb') as dst:
+        rest = b''
+        while True:
+            chunk = src.read(1 << 24)
+            if not chunk:
+                dst.write(pattern.sub(b'', rest))
+                return
+            data = rest + chunk
+            #only whole lines, the last partial one waits for the next chunk
+            end = data.rfind(b'\n') + 1
+            dst.write(pattern.sub(b'', data[:end]))
+            rest = data[end:]
+
+def readPLYHeader(f):
+    """ Parse a PLY header. Returns (format, elements) where elements is a list of
+        (name, count, [(property name, type, list count type or None)])
+    """
+    if f.readline().strip() != b'ply':
+        return None
+    fmt = None
+    elements = []
+    while True:
+        line = f.readline()
+        if not line:
+            return None
+        words = line.split()
+        if not words or words[0] in (b'comment', b'obj_info'):
+            continue
+        if words[0] == b'format':
+            fmt = words[1].decode()
+        elif words[0] == b'element':
+            elements.append((words[1].decode(), int(words[2]), []))
+        elif words[0] == b'property':
+            if words[1] == b'list':
+                elements[-1][2].append((words[4].decode(), words[3].decode(), words[2].decode()))
+            else:
+                elements[-1][2].append((words[2].decode(), words[1].decode(), None))
+        elif words[0] == b'end_header':
+            return (fmt, elements)
+
+def readPLYPositions(filePath):
+    with open(filePath, 'rb') as f:
+        header = readPLYHeader(f)
+        if header is None:
+            return None
+        fmt, elements = header
+        names = [e[0] for e in elements]
+        if 'vertex' not in names:
+            return None
+        vertexElement = elements[names.index('vertex')]
+        props = vertexElement[2]
+        propNames = [p[0] for p in props]
+        if any(p[2] is not None for p in props) or not all(a in propNames for a in ('x', 'y', 'z')):
+            return None
+        xyz = [propNames.index(a) for a in ('x', 'y', 'z')]
+        count = vertexElement[1]
+        coords = array('f')
+        if fmt == 'ascii':
+            #skip the lines of any elements before the vertices, one line per entry
+            for e in elements[:names.index('vertex')]:
+                for i in range(e[1]):
+                    f.readline()
+            for i in range(count):
+                values = f.readline().split()
+                coords.append(float(values[xyz[0]]))
+                coords.append(float(values[xyz[1]]))
+                coords.append(float(values[xyz[2]]))
+            return coords
+        if fmt not in ('binary_little_endian', 'binary_big_endian'):
+            return None
+        order = '<' if fmt == 'binary_little_endian' else '>'
+        for e in elements[:names.index('vertex')]:
+            if any(p[2] is not None for p in e[2]):
+                #variable size entries, can't skip without parsing
+                return None
+            f.seek(e[1]*struct.calcsize(order + ''.join(PLY_TYPES[p[1]] for p in e[2])), os.SEEK_CUR)
+        vertexFormat = order + ''.join(PLY_TYPES[p[1]] for p in props)
+        data = f.read(count*struct.calcsize(vertexFormat))
+    if vertexFormat[1:4] == 'fff' and xyz == [0, 1, 2] and len(props) == 3:
+        #tightly packed float positions can be copied straight into the array
+        coords.frombytes(data)
+        if (order == '<') != (sys.byteorder == 'little'):
+            coords.byteswap()
+        return coords
+    for values in struct.iter_unpack(vertexFormat, data):
+        coords.append(values[xyz[0]])
+        coords.append(values[xyz[1]])
+        coords.append(values[xyz[2]])
+    return coords
+
+
+class MeshData:
+    """ Vertices and faces of one frame, laid out like Blender's foreach_set takes them: flat positions,
+        the number of corners of each face and the vertex index of every corner. uvs has two floats per
+        corner or is None. faceMaterials indexes materialNames, the usemtl names of an OBJ file (None for
+        faces before the first usemtl), and is empty for formats without materials
+    """
+    def __init__(self):
+        self.coords = array('f')
+        self.faceSizes = array('i')
+        self.faceIndices = array('i')
+        self.uvs = None
+        self.faceMaterials = array('i')
+        self.materialNames = []
+
+def readMesh(fileType, filePath, matrix=None):
+    """ Read the vertices and faces of a mesh file into a MeshData, positions transformed by a 4x4 matrix.
+        None for the variants the positions-only readers don't support either, or if a face uses a vertex
+        that doesn't exist
+    """
+    if fileType == 'obj':
+        mesh = readOBJMesh(filePath)
+    elif fileType == 'stl':
+        mesh = readSTLMesh(filePath)
+    elif fileType == 'ply':
+        mesh = readPLYMesh(filePath)
+    else:
+        return None
+    if mesh is None:
+        return None
+    if not validIndices(mesh):
+        return None
+    transformPositions(mesh.coords, matrix)
+    return mesh
+
+def validIndices(mesh):
+    return len(mesh.faceIndices) == 0 or (min(mesh.faceIndices) >= 0 and max(mesh.faceIndices) < len(mesh.coords)//3)
+
+def objIndex(word, count):
+    """ 0 based index of a 1 based (or negative, counted back from the end) OBJ index
+    """
+    i = int(word)
+    return i-1 if i > 0 else count+i
+
+def readOBJMesh(filePath):
+    mesh = MeshData()
+    texCoords = array('f')
+    uvs = array('f')
+    hasUVs = True
+    materials = {}
+    material = None
+    with open(filePath, 'rb') as f:
+        for line in f:
+            if line[:2] == b'v ' or line[:2] == b'v\t':
+                values = line.split()
+                mesh.coords.append(float(values[1]))
+                mesh.coords.append(float(values[2]))
+                mesh.coords.append(float(values[3]))
+            elif line[:3] == b'vt ' or line[:3] == b'vt\t':
+                values = line.split()
+                texCoords.append(float(values[1]))
+                texCoords.append(float(values[2]) if len(values) > 2 else 0.0)
+            elif line[:2] == b'f ' or line[:2] == b'f\t':
+                #f v/vt/vn ..., faces with less than three corners are only edges
+                corners = line.split()[1:]
+                if len(corners) < 3:
+                    continue
+                numVerts = len(mesh.coords)//3
+                for corner in corners:
+                    parts = corner.split(b'/')
+                    mesh.faceIndices.append(objIndex(parts[0], numVerts))
+                    if len(parts) > 1 and parts[1]:
+                        t = 2*objIndex(parts[1], len(texCoords)//2)
+                        uvs.append(texCoords[t])
+                        uvs.append(texCoords[t+1])
+                    else:
+                        hasUVs = False
+                mesh.faceSizes.append(len(corners))
+                mesh.faceMaterials.append(materials.setdefault(material, len(materials)))
+            elif line[:7] == b'usemtl ' or line[:7] == b'usemtl\t':
+                material = line[7:].strip().decode('utf-8', 'replace')
+    mesh.materialNames = list(materials)
+    if hasUVs and len(uvs) > 0:
+        mesh.uvs = uvs
+    return mesh
+
+def readSTLMesh(filePath):
+    """ Vertices merged like readSTLPositions
+    """
+    data = readSTLTriangles(filePath)
+    if data is None:
+        return None
+    mesh = MeshData()
+    index = {}
+    for tri in struct.iter_unpack('<12fH', data):
+        mesh.faceIndices.append(index.setdefault(tri[3:6], len(index)))
+        mesh.faceIndices.append(index.setdefault(tri[6:9], len(index)))
+        mesh.faceIndices.append(index.setdefault(tri[9:12], len(index)))
+    for v in index:
+        mesh.coords.extend(v)
+    mesh.faceSizes = array('i', [3])*(len(mesh.faceIndices)//3)
+    return mesh
+
+def readPLYRows(f, fmt, count, props):
+    """ The entries of a PLY element as lists of values, list properties as lists of their own
+    """
+    if fmt == 'ascii':
+        for i in range(count):
+            words = f.readline().split()
+            values = []
+            pos = 0
+            for name, type, countType in props:
+                if countType is None:
+                    values.append(float(words[pos]))
+                    pos += 1
+                else:
+                    n = int(words[pos])
+                    if len(words) < pos+1+n:
+                        raise ValueError('PLY list is missing values')
+                    values.append([int(w) for w in words[pos+1:pos+1+n]])
+                    pos += 1+n
+            yield values
+        return
+    order = '<' if fmt == 'binary_little_endian' else '>'
+    if all(p[2] is None for p in props):
+        rowFormat = order + ''.join(PLY_TYPES[p[1]] for p in props)
+        yield from struct.iter_unpack(rowFormat, f.read(count*struct.calcsize(rowFormat)))
+        return
+    for i in range(count):
+        values = []
+        for name, type, countType in props:
+            if countType is None:
+                valueFormat = order + PLY_TYPES[type]
+                values.append(struct.unpack(valueFormat, f.read(struct.calcsize(valueFormat)))[0])
+            else:
+                countFormat = order + PLY_TYPES[countType]
+                n = struct.unpack(countFormat, f.read(struct.calcsize(countFormat)))[0]
+                listFormat = order + str(n) + PLY_TYPES[type]
+                values.append(struct.unpack(listFormat, f.read(struct.calcsize(listFormat))))
+        yield values
+
+def readPLYMesh(filePath):
+    with open(filePath, 'rb') as f:
+        header = readPLYHeader(f)
+        if header is None:
+            return None
+        fmt, elements = header
+        if fmt not in ('ascii', 'binary_little_endian', 'binary_big_endian'):
+            return None
+        names = [e[0] for e in elements]
+        if 'vertex' not in names:
+            return None
+        propNames = [p[0] for p in elements[names.index('vertex')][2]]
+        if not all(a in propNames for a in ('x', 'y', 'z')):
+            return None
+        x, y, z = [propNames.index(a) for a in ('x', 'y', 'z')]
+        uv = None
+        for a, b in PLY_UV_NAMES:
+            if a in propNames and b in propNames:
+                uv = (propNames.index(a), propNames.index(b))
+                break
+        mesh = MeshData()
+        vertexUVs = array('f')
+        for ind, (name, count, props) in enumerate(elements):
+            if name == 'face':
+                faceNames = [p[0] for p in props]
+                if 'vertex_indices' in faceNames:
+                    corners = faceNames.index('vertex_indices')
+                elif 'vertex_index' in faceNames:
+                    corners = faceNames.index('vertex_index')
+                else:
+                    return None
+            rows = readPLYRows(f, fmt, count, props)
+            if name == 'vertex':
+                for values in rows:
+                    mesh.coords.append(values[x])
+                    mesh.coords.append(values[y])
+                    mesh.coords.append(values[z])
+                    if uv is not None:
+                        vertexUVs.append(values[uv[0]])
+                        vertexUVs.append(values[uv[1]])
+            elif name == 'face':
+                for values in rows:
+                    mesh.faceSizes.append(len(values[corners]))
+                    mesh.faceIndices.extend(values[corners])
+            elif 'vertex' in names[ind+1:] or 'face' in names[ind+1:]:
+                for values in rows:
+                    pass
+            else:
+                #elements after the vertices and faces don't need to be read
+                break
+    if uv is not None and validIndices(mesh):
+        mesh.uvs = array('f')
+        for i in mesh.faceIndices:
+            mesh.uvs.append(vertexUVs[2*i])
+            mesh.uvs.append(vertexUVs[2*i+1])
+    return mesh
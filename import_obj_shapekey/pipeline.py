@@ -0,0 +1,165 @@
+import os
+import shutil
+import struct
+import tempfile
+import multiprocessing
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from . import meshio
+
+#Parallel frame parsing. Workers only use the bpy-free readers and hand the positions back
+#through raw float32 temp files, the main thread just reads them back and writes the shape keys.
+
+
+def defaultWorkerCount():
+    return max(1, (os.cpu_count() or 1) - 1)
+
+#what the readers raise for files that are broken (e.g. truncated)
+READ_ERRORS = (OSError, ValueError, IndexError, KeyError, struct.error)
+
+def readPositions(fileType, filePath, matrix, objects):
+    """ meshio.readPositions, but None for files that are broken as well,
+        so they fall back to the importer like unsupported ones
+    """
+    try:
+        return meshio.readPositions(fileType, filePath, matrix, objects)
+    except READ_ERRORS:
+        return None
+
+def readMesh(fileType, filePath, matrix):
+    """ meshio.readMesh, None for broken files like readPositions
+    """
+    try:
+        return meshio.readMesh(fileType, filePath, matrix)
+    except READ_ERRORS:
+        return None
+
+def parseToFile(fileType, filePath, matrix, objects, outPath, cache=None, signature=''):
+    """ Worker side: parse a file and write its positions straight into the cache, or to outPath if
+        there's no cache or the entry can't be written.
+        Returns (number of floats, path they were written to), or (None, None) if the reader can't handle the file
+    """
+    coords = readPositions(fileType, filePath, matrix, objects)
+    if coords is None:
+        return (None, None)
+    if cache is not None:
+        entry = cache.write(filePath, signature, coords)
+        if entry is not None:
+            return (len(coords), entry)
+    with open(outPath, 'wb') as f:
+        coords.tofile(f)
+    return (len(coords), outPath)
+
+def loadParsed(path, count):
+    coords = array('f')
+    with open(path, 'rb') as f:
+        coords.fromfile(f, count)
+    return coords
+
+def budgetInFlight(budget, frameBytes, numWorkers=0, maxInFlight=0):
+    """ (numWorkers, maxInFlight) for readFrames, lowered so the frames read ahead take at most budget bytes
+        when each costs frameBytes. At least one frame is always read. A budget of 0 leaves both as they are
+    """
+    if budget <= 0 or frameBytes <= 0:
+        return (numWorkers, maxInFlight)
+    if numWorkers <= 0:
+        numWorkers = defaultWorkerCount()
+    if maxInFlight <= 0:
+        maxInFlight = 2*numWorkers
+    maxInFlight = max(1, min(maxInFlight, budget // frameBytes))
+    #a process that can't get a frame to parse only costs memory
+    return (min(numWorkers, maxInFlight), maxInFlight)
+
+def readVertexCounts(fileType, files, numWorkers=0):
+    """ meshio.readVertexCount of every file, in order. Mostly waiting on the disk, so threads are enough
+    """
+    if numWorkers <= 0:
+        numWorkers = defaultWorkerCount()
+    def count(f):
+        try:
+            return meshio.readVertexCount(fileType, f)
+        except (OSError, ValueError, IndexError):
+            return None
+    if numWorkers == 1 or len(files) < 2:
+        return [count(f) for f in files]
+    with ThreadPoolExecutor(max_workers=min(4*numWorkers, len(files))) as pool:
+        return list(pool.map(count, files))
+
+def topologyRuns(counts):
+    """ (start, end) index ranges of files with the same vertex count. Files whose count isn't known
+        are assumed to match the ones before them
+    """
+    runs = []
+    start = 0
+    current = None
+    for i, count in enumerate(counts):
+        if count is None:
+            continue
+        if current is not None and count != current:
+            runs.append((start, i))
+            start = i
+        current = count
+    runs.append((start, len(counts)))
+    return runs
+
+def readFrames(fileType, files, matrix=None, numWorkers=0, maxInFlight=0, cache=None, signature='', objects=None):
+    """ Generator yielding (filePath, positions) for every file, in the order given.
+        Positions are None for files the reader can't handle. objects is passed on to meshio.readPositions.
+        numWorkers processes parse ahead of the consumer, with at most maxInFlight frames
+        parsed or being parsed at any time so memory stays bounded. 0 picks a default for both.
+        If a FrameCache is given, cached frames are used as is and newly parsed ones are added to it
+    """
+    if numWorkers <= 0:
+        numWorkers = defaultWorkerCount()
+    if maxInFlight <= 0:
+        maxInFlight = 2*numWorkers
+    if numWorkers == 1 or len(files) < 2:
+        for f in files:
+            coords = cache.get(f, signature) if cache is not None else None
+            if coords is None:
+                coords = readPositions(fileType, f, matrix, objects)
+                if coords is not None and cache is not None:
+                    cache.put(f, signature, coords)
+            yield (f, coords)
+        return
+    
+    def finish(f, outPath, job):
+        if outPath is None:
+            #cache hit, job is the positions
+            return (f, job)
+        count, path = job.result()
+        if count is None:
+            return (f, None)
+        try:
+            coords = loadParsed(path, count)
+        except (OSError, EOFError):
+            #the cache entry was evicted before it got here, parse it again
+            return (f, readPositions(fileType, f, matrix, objects))
+        if path == outPath:
+            os.remove(outPath)
+        else:
+            #the worker already wrote the cache entry
+            cache.added(4*count)
+        return (f, coords)
+    
+    tempDir = tempfile.mkdtemp(prefix='objsk_')
+    #fork isn't safe from inside Blender
+    pool = ProcessPoolExecutor(max_workers=min(numWorkers, len(files)), mp_context=multiprocessing.get_context('spawn'))
+    try:
+        pending = deque()
+        for i, f in enumerate(files):
+            coords = cache.get(f, signature) if cache is not None else None
+            if coords is not None:
+                pending.append((f, None, coords))
+            else:
+                outPath = os.path.join(tempDir, '%d.f32' % i)
+                pending.append((f, outPath, pool.submit(parseToFile, fileType, f, matrix, objects, outPath, cache, signature)))
+            if len(pending) >= maxInFlight:
+                yield finish(*pending.popleft())
+        while pending:
+            yield finish(*pending.popleft())
+    finally:
+        #stops any remaining work if the consumer bails out early
+        pool.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(tempDir, ignore_errors=True)
@@ -0,0 +1,97 @@
+import os
+import struct
+import numpy as np
+
+#PC2 and MDD point caches: the vertex positions of every frame packed as float32 in one file.
+#PC2 (little endian): 'POINTCACHE2\0', version 1, number of points, start frame, sample rate, number of samples,
+#then the xyz of every point, frame after frame.
+#MDD (big endian): number of frames, number of points, the time of every frame in seconds, then the frames.
+#Neither holds any topology, so they're always applied to an existing mesh with the same vertex count.
+
+FORMATS = ('pc2', 'mdd')
+PC2_MAGIC = b'POINTCACHE2\0'
+PC2_HEADER = struct.Struct('<12siiffi')
+MDD_HEADER = struct.Struct('>2i')
+
+
+def writePointCache(path, frames, numPoints, numFrames, fps=24.0, start=1.0):
+    """ Write numFrames flat float32 position arrays from the frames iterable, one at a time.
+        The format is picked by the file extension
+    """
+    fileType = os.path.splitext(path)[1][1:].lower()
+    if fileType not in FORMATS:
+        raise ValueError("%s is not a .pc2 or .mdd file" % path)
+    dtype = '<f4' if fileType == 'pc2' else '>f4'
+    written = 0
+    tempPath = path + '.tmp'
+    try:
+        with open(tempPath, 'wb') as f:
+            if fileType == 'pc2':
+                f.write(PC2_HEADER.pack(PC2_MAGIC, 1, numPoints, start, 1.0, numFrames))
+            else:
+                f.write(MDD_HEADER.pack(numFrames, numPoints))
+                f.write((np.arange(numFrames, dtype=np.float64)/fps).astype('>f4').tobytes())
+            for coords in frames:
+                coords = np.asarray(coords, dtype=np.float32)
+                if len(coords) != 3*numPoints:
+                    raise ValueError("Frame %d has %d points instead of %d" % (written+1, len(coords)//3, numPoints))
+                f.write(coords.astype(dtype, copy=False).tobytes())
+                written += 1
+        if written != numFrames:
+            raise ValueError("Got %d frames instead of %d" % (written, numFrames))
+    except BaseException:
+        #never leave half a cache behind
+        os.remove(tempPath)
+        raise
+    os.replace(tempPath, path)
+
+
+class PointCache:
+    """ Memory-mapped read access to a PC2 or MDD file. With skip set the first frames are left out, so
+        the rest can be played back after a base mesh like a framestore.FrameStore
+    """
+    def __init__(self, path, skip=0):
+        self.path = path
+        fileType = os.path.splitext(path)[1][1:].lower()
+        size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            if fileType == 'pc2':
+                header = f.read(PC2_HEADER.size)
+                if len(header) < PC2_HEADER.size:
+                    raise ValueError("%s is not a PC2 file" % path)
+                magic, version, numPoints, start, rate, numFrames = PC2_HEADER.unpack(header)
+                if magic != PC2_MAGIC:
+                    raise ValueError("%s is not a PC2 file" % path)
+                offset = PC2_HEADER.size
+                dtype = '<f4'
+            elif fileType == 'mdd':
+                header = f.read(MDD_HEADER.size)
+                if len(header) < MDD_HEADER.size:
+                    raise ValueError("%s is not an MDD file" % path)
+                numFrames, numPoints = MDD_HEADER.unpack(header)
+                offset = MDD_HEADER.size + 4*numFrames
+                dtype = '>f4'
+            else:
+                raise ValueError("%s is not a .pc2 or .mdd file" % path)
+        if numPoints < 0 or numFrames < 0 or size < offset + 12*numPoints*numFrames:
+            raise ValueError("%s is truncated" % path)
+        self.numVerts = numPoints
+        self.skip = min(skip, numFrames)
+        self.numFrames = numFrames - self.skip
+        self.native = np.dtype(dtype).isnative
+        if numPoints == 0 or numFrames == 0:
+            self.data = np.zeros((numFrames, numPoints, 3), dtype=np.float32)
+        else:
+            self.data = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(numFrames, numPoints, 3))
+
+    def positions(self, index, base=None):
+        """ Flat float32 positions of frame index (after the skipped ones), a view into the file where
+            the byte order allows it
+        """
+        frame = self.data[index + self.skip].reshape(-1)
+        if self.native:
+            return frame
+        return frame.astype(np.float32)
+
+    def close(self):
+        self.data = None
@@ -0,0 +1,148 @@
+import os
+import re
+import base64
+import numpy as np
+
+#Finding and ordering the files of a sequence. Doesn't depend on bpy.
+#A folder is read with a single os.scandir pass that also returns each file's size and modification time,
+#so checking a sequence for missing or changed files doesn't need a stat call per file. Files are ordered
+#by their frame number, the last run of digits in the name.
+#SequenceIndex is the compact form of a sequence's file list that gets saved with the object: the names as one
+#printf pattern plus frame numbers when they all follow it (cloth_%04d.obj), and the sizes and modification
+#times as packed int64 arrays.
+
+FRAME_NUMBER = re.compile(r'([0-9]+)[^0-9]*$')
+DIGITS = re.compile(r'([0-9]+)')
+
+
+def alphanumKey(string):
+    """ Turn a string into a list of string and number chunks
+        "z23a" -> ["z", 23, "a"]
+    """
+    return [int(c) if c.isdigit() else c for c in DIGITS.split(string)]
+
+def frameKey(path):
+    """ Sort key of a sequence file: its frame number, then the name in natural order for files with
+        the same or no number
+        "/sims/cloth_0012.obj" -> (12, ["cloth_", 12, ".obj"])
+    """
+    name = os.path.basename(path)
+    match = FRAME_NUMBER.search(name)
+    return (int(match.group(1)) if match else -1, alphanumKey(name))
+
+def scanSequence(directory, prefix, fileExt):
+    """ (path, size, mtime_ns) of every file in directory matching prefix*.fileExt, in frame order
+    """
+    suffix = '.' + fileExt
+    files = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if not name.startswith(prefix) or not name.endswith(suffix) or len(name) < len(prefix)+len(suffix):
+                    continue
+                if name[0] == '.' and prefix[:1] != '.':
+                    #hidden files, glob didn't match those either
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((os.path.join(directory, name), st.st_size, st.st_mtime_ns))
+    except OSError:
+        return []
+    files.sort(key=lambda f: frameKey(f[0]))
+    return files
+
+def findSequenceFiles(directory, prefix, fileExt):
+    """ All files in directory matching prefix*.fileExt, in frame order
+    """
+    return [path for path, size, mtime in scanSequence(directory, prefix, fileExt)]
+
+
+def packArray(values):
+    return base64.b64encode(np.asarray(values, dtype='<i8').tobytes()).decode('ascii')
+
+def unpackArray(text):
+    return np.frombuffer(base64.b64decode(text), dtype='<i8')
+
+def namePattern(names, frames):
+    """ printf pattern that gives every name from its frame number, or None if there's none
+    """
+    match = FRAME_NUMBER.search(names[0])
+    if match is None:
+        return None
+    head = names[0][:match.start(1)].replace('%', '%%')
+    tail = names[0][match.end(1):].replace('%', '%%')
+    for number in ('%%0%dd' % len(match.group(1)), '%d'):
+        pattern = head + number + tail
+        if all(pattern % frame == name for name, frame in zip(names, frames)):
+            return pattern
+    return None
+
+
+class SequenceIndex:
+    """ Files of a sequence in frame order, with the size and modification time each had when it was read
+    """
+    def __init__(self, directory, frames, sizes, mtimes, pattern=None, names=None):
+        self.directory = directory
+        self.frames = frames
+        self.sizes = sizes
+        self.mtimes = mtimes
+        #either pattern or names is set
+        self.pattern = pattern
+        self.names = names
+
+    @classmethod
+    def fromScan(cls, directory, entries):
+        """ Index of (path, size, mtime_ns) entries as returned by scanSequence
+        """
+        names = [os.path.basename(path) for path, size, mtime in entries]
+        frames = [frameKey(name)[0] for name in names]
+        pattern = namePattern(names, frames) if len(names) > 0 else None
+        return cls(directory, np.array(frames, dtype=np.int64), np.array([e[1] for e in entries], dtype=np.int64),
+                   np.array([e[2] for e in entries], dtype=np.int64), pattern, None if pattern is not None else names)
+
+    @classmethod
+    def unpack(cls, directory, pattern, names, frames, sizes, mtimes):
+        return cls(directory, unpackArray(frames), unpackArray(sizes), unpackArray(mtimes),
+                   pattern or None, None if pattern else names.split('\n'))
+
+    def pack(self):
+        """ (pattern, names, frames, sizes, mtimes) as strings, names is only filled in if there's no pattern
+        """
+        return (self.pattern or '', '\n'.join(self.names) if self.pattern is None else '',
+                packArray(self.frames), packArray(self.sizes), packArray(self.mtimes))
+
+    def append(self, path, size, mtime):
+        name = os.path.basename(path)
+        frame = frameKey(name)[0]
+        if self.pattern is not None and self.pattern % frame != name:
+            self.names = self.paths(False)
+            self.pattern = None
+        if self.names is not None:
+            self.names.append(name)
+        self.frames = np.append(self.frames, frame)
+        self.sizes = np.append(self.sizes, size)
+        self.mtimes = np.append(self.mtimes, mtime)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def name(self, i):
+        if self.pattern is not None:
+            return self.pattern % self.frames[i]
+        return self.names[i]
+
+    def path(self, i):
+        return os.path.join(self.directory, self.name(i))
+
+    def paths(self, full=True):
+        if full:
+            return [self.path(i) for i in range(len(self))]
+        return [self.name(i) for i in range(len(self))]
+
+    def stamp(self, i):
+        return (int(self.sizes[i]), int(self.mtimes[i]))
@@ -0,0 +1,1813 @@
+import bpy
+import os
+import re
+import time
+import shutil
+import hashlib
+import tempfile
+import uuid
+import numpy as np
+from array import array
+from bpy_extras.io_utils import (
+    ImportHelper,
+    ExportHelper,
+    orientation_helper,
+    axis_conversion)
+from mathutils import Matrix
+from . import meshio
+from . import pipeline
+from .cache import FrameCache
+from .watch import FolderWatcher
+from .framestore import FrameStore, FrameStoreWriter
+from .window import FrameWindow
+from . import pointcache
+from .scan import frameKey, scanSequence, SequenceIndex
+from .stats import ImportStats
+from bpy.app.handlers import persistent
+
+#Pretty much all of the menu and setting stuff is copied from Stop Motion OBJ (https://github.com/neverhood311/Stop-motion-OBJ)
+
+
+def deselectAll():
+    for ob in bpy.context.scene.objects:
+        ob.select_set(state=False)
+        
+def getPreferences():
+    return bpy.context.preferences.addons[__package__].preferences
+
+def getCacheDirectory():
+    prefs = getPreferences()
+    if prefs.cacheDirectory == "":
+        return bpy.utils.user_resource('DATAFILES', path='objsk_cache')
+    return bpy.path.abspath(prefs.cacheDirectory)
+
+def storeFilePath(directory, prefix, frameRange=None):
+    """ Where the frame store of the sequence directory/prefix* goes, picked by the Frame Store Location preference
+    """
+    name = (prefix or 'sequence') + ('_%d-%d' % frameRange if frameRange is not None else '')
+    location = getPreferences().storeLocation
+    if location == 'SEQUENCE':
+        return os.path.join(directory, name+'.objsk')
+    #these folders hold the stores of many sequences, tell them apart by the folder they come from
+    name += '_' + hashlib.sha1(os.path.normcase(directory).encode('utf-8')).hexdigest()[:8]
+    if location == 'BLEND' and bpy.data.filepath:
+        return os.path.join(os.path.dirname(bpy.data.filepath), name+'.objsk')
+    return os.path.join(getCacheDirectory(), 'stores', name+'.objsk')
+
+def getFrameCache():
+    """ The frame cache set up in the addon preferences, or None if it's disabled
+    """
+    prefs = getPreferences()
+    if not prefs.useCache:
+        return None
+    return FrameCache(getCacheDirectory(), prefs.cacheSizeLimit*1024*1024)
+
+def fileStamp(filePath):
+    """ (size, modification time) of a file, used to tell if it changed since it was read
+    """
+    try:
+        st = os.stat(filePath)
+    except OSError:
+        return (-1, -1)
+    return (st.st_size, st.st_mtime_ns)
+
+def getVertexCoords(mesh):
+    """ Read the positions of every vertex in a mesh into one flat float32 array
+        [x0, y0, z0, x1, y1, z1, ...]
+    """
+    coords = array('f', [0.0]) * (3*len(mesh.vertices))
+    mesh.vertices.foreach_get('co', coords)
+    return coords
+
+def removeImported(objs):
+    """ Delete objects made by the importer together with their meshes, materials and images,
+        so nothing of them is left behind as orphan data
+    """
+    meshes = {}
+    materials = {}
+    for obj in objs:
+        if obj.data is not None:
+            meshes[obj.data.name] = obj.data
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                materials[slot.material.name] = slot.material
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in meshes.values():
+        for mat in mesh.materials:
+            if mat is not None:
+                materials[mat.name] = mat
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    images = {}
+    for mat in materials.values():
+        if mat.users != 0:
+            continue
+        if mat.node_tree is not None:
+            for node in mat.node_tree.nodes:
+                if node.type == 'TEX_IMAGE' and node.image is not None:
+                    images[node.image.name] = node.image
+        bpy.data.materials.remove(mat)
+    for image in images.values():
+        if image.users == 0:
+            bpy.data.images.remove(image)
+
+def readAheadLimits(numVerts, fileSize):
+    """ (numWorkers, maxInFlight) from the preferences, lowered so the frames read ahead of the shape key
+        writes fit into the memory budget. A frame is counted as the file being parsed plus its positions
+    """
+    prefs = getPreferences()
+    return pipeline.budgetInFlight(prefs.memoryBudget*1024*1024, 12*numVerts + fileSize, prefs.numWorkers, prefs.maxInFlight)
+
+
+class MeshImporter(bpy.types.PropertyGroup):
+    #OBJ settings
+    obj_global_scale: bpy.props.FloatProperty(
+        name="Scale",
+        soft_min=0.001,
+        soft_max=1000.0,
+        min=1e-6,
+        max=1e6,
+        default=1.0)
+    obj_use_groups_as_vgroups: bpy.props.BoolProperty(name="Poly Groups", description="Import OBJ groups as vertex groups", default=False)
+    obj_global_clamp_size: bpy.props.FloatProperty(
+        name="Clamp Size",
+        description="Clamp bounds under this value (zero to disable)",
+        min=0.0,
+        max=1000.0,
+        soft_min=0.0,
+        soft_max=1000.0,
+        default=0.0)
+    obj_use_split_objects: bpy.props.BoolProperty(name="Split By Object", description="Import each OBJ 'o' as a separate object", default=True)
+    obj_use_split_groups: bpy.props.BoolProperty(name="Split By Group", description="Import each OBJ 'g' as a separate object", default=False)
+    
+    #STL settings
+    stl_global_scale: bpy.props.FloatProperty(
+        name="Scale",
+        soft_min=0.001,
+        soft_max=1000.0,
+        min=1e-6,
+        max=1e6,
+        default=1.0)
+    stl_use_scene_unit: bpy.props.BoolProperty(name="Scene Unit", description="Apply current scene's unit (as defined by unit scale) to imported data", default=False)
+    stl_use_facet_normal: bpy.props.BoolProperty(name="Facet Normals", description="Use imported facet normals", default=False)
+    
+    #PLY settings
+    ply_global_scale: bpy.props.FloatProperty(
+        name="Scale",
+        soft_min=0.001,
+        soft_max=1000.0,
+        min=1e-6,
+        max=1e6,
+        default=1.0)
+    ply_use_scene_unit: bpy.props.BoolProperty(name="Scene Unit", description="Apply current scene's unit (as defined by unit scale) to imported data", default=False)
+    
+    #Shared settings
+    axis_forward: bpy.props.StringProperty(name="Axis Forward", default="NEGATIVE_Z")
+    axis_up: bpy.props.StringProperty(name="Axis Up", default="Y")
+    
+    def draw(self):
+        pass
+    
+    def importMatrix(self, fileType):
+        """ Axis conversion and scale the importer applies for this file type
+        """
+        if fileType == 'obj':
+            scale = self.obj_global_scale
+        elif fileType == 'stl':
+            scale = self.stl_global_scale
+            if self.stl_use_scene_unit:
+                scale *= bpy.context.scene.unit_settings.scale_length
+        elif fileType == 'ply':
+            scale = self.ply_global_scale
+            if self.ply_use_scene_unit:
+                scale *= bpy.context.scene.unit_settings.scale_length
+        forward = self.axis_forward.replace('NEGATIVE_', '-')
+        up = self.axis_up.replace('NEGATIVE_', '-')
+        return axis_conversion(from_forward=forward, from_up=up).to_4x4() @ Matrix.Scale(scale, 4)
+    
+    def geometrySettings(self, fileType):
+        """ Settings that change the imported vertex positions, used to key cached frames
+        """
+        if fileType == 'obj':
+            return (fileType, self.obj_global_scale, self.obj_global_clamp_size, self.obj_use_split_objects, self.obj_use_split_groups, self.axis_forward, self.axis_up)
+        if fileType == 'stl':
+            return (fileType, self.stl_global_scale, self.stl_use_scene_unit, self.axis_forward, self.axis_up)
+        return (fileType, self.ply_global_scale, self.ply_use_scene_unit, self.axis_forward, self.axis_up)
+    
+    def load(self, fileType, filePath, stats=None, geometryOnly=False):
+        """ With geometryOnly, OBJ files are imported without their materials and textures
+        """
+        start = time.perf_counter()
+        if fileType == 'obj' and geometryOnly:
+            #same file name in a temporary folder, objects named after the file keep their name
+            tempDir = tempfile.mkdtemp(prefix='objsk_')
+            try:
+                tempPath = os.path.join(tempDir, os.path.basename(filePath))
+                meshio.stripOBJMaterials(filePath, tempPath)
+                self.loadOBJ(tempPath)
+            finally:
+                shutil.rmtree(tempDir, ignore_errors=True)
+        elif fileType == 'obj':
+            self.loadOBJ(filePath)
+        elif fileType == 'stl':
+            self.loadSTL(filePath)
+        elif fileType == 'ply':
+            self.loadPLY(filePath)
+        if stats is not None:
+            stats.addPhase('importer', time.perf_counter() - start)
+    
+    def loadOBJ(self, filePath):
+        if bpy.app.version >= (3, 2, 0):
+            forward = self.axis_forward
+            if forward[0] == '-':
+                forward = 'NEGATIVE_'+forward[1:]
+            up = self.axis_up
+            if up[0] == '-':
+                up = 'NEGATIVE_'+up[1:]
+            bpy.ops.wm.obj_import(
+                filepath=filePath,
+                global_scale=self.obj_global_scale,
+                clamp_size=self.obj_global_clamp_size,
+                forward_axis=forward,
+                up_axis=up,
+                use_split_objects=self.obj_use_split_objects,
+                use_split_groups=self.obj_use_split_groups,
+                import_vertex_groups=self.obj_use_groups_as_vgroups)
+                
+    def loadSTL(self, filePath):
+        if bpy.app.version >= (3, 2, 0):
+            forward = self.axis_forward
+            if forward[0] == '-':
+                forward = 'NEGATIVE_'+forward[1:]
+            up = self.axis_up
+            if up[0] == '-':
+                up = 'NEGATIVE_'+up[1:]
+            bpy.ops.wm.stl_import(
+                filepath=filePath,
+                global_scale=self.stl_global_scale,
+                use_scene_unit=self.stl_use_scene_unit,
+                use_facet_normal=self.stl_use_facet_normal,
+                forward_axis=forward,
+                up_axis=up)
+            
+    def loadPLY(self, filePath):
+        if bpy.app.version >= (3, 2, 0):
+            forward = self.axis_forward
+            if forward[0] == '-':
+                forward = 'NEGATIVE_'+forward[1:]
+            up = self.axis_up
+            if up[0] == '-':
+                up = 'NEGATIVE_'+up[1:]
+            bpy.ops.wm.ply_import(
+                filepath=filePath,
+                global_scale=self.ply_global_scale,
+                use_scene_unit=self.ply_use_scene_unit,
+                forward_axis=forward,
+                up_axis=up)
+
+
+#(file token, folder) -> decoded SequenceIndex, so the packed file list is only decoded once per session
+fileIndexes = {}
+
+class MeshSequenceSettings(bpy.types.PropertyGroup):
+    initialized: bpy.props.BoolProperty(default=False)
+    dirPath: bpy.props.StringProperty(
+        name="Root Folder",
+        description="Only .OBJ files will be listed",
+        subtype="DIR_PATH")
+    fileExt: bpy.props.StringProperty(name='File Ext')
+    filePrefix: bpy.props.StringProperty(name='File Name Prefix')
+    numMeshes: bpy.props.IntProperty()
+    importSettings: bpy.props.PointerProperty(type=MeshImporter)
+    #files of the sequence as packed by SequenceIndex.pack, relative to dirPath. fileToken changes whenever they do
+    filePattern: bpy.props.StringProperty()
+    fileNames: bpy.props.StringProperty()
+    fileFrames: bpy.props.StringProperty()
+    fileSizes: bpy.props.StringProperty()
+    fileTimes: bpy.props.StringProperty()
+    fileToken: bpy.props.StringProperty()
+    #name of the OBJ object or group this object is read from, and what's shared by all objects of one sequence
+    objectName: bpy.props.StringProperty()
+    sequenceId: bpy.props.StringProperty()
+    topologyMode: bpy.props.StringProperty(default='ABORT')
+    #part of a sequence split where its topology changes: first and last index of the files it covers in
+    #the sorted sequence and the number of frames before it in the timeline
+    useFrameRange: bpy.props.BoolProperty(default=False)
+    frameRange: bpy.props.IntVectorProperty(size=2)
+    frameOffset: bpy.props.IntProperty()
+    #matrix passed to the positions-only reader, only valid if useReader is set
+    useReader: bpy.props.BoolProperty(default=False)
+    readMatrix: bpy.props.FloatVectorProperty(size=16)
+    storageMode: bpy.props.StringProperty(default='KEYS')
+    staticThreshold: bpy.props.FloatProperty(default=1e-6)
+    reduceTolerance: bpy.props.FloatProperty(default=0.0)
+    reduceMode: bpy.props.StringProperty(default='HOLD')
+    #frame store file for storage modes other than KEYS
+    storePath: bpy.props.StringProperty(subtype='FILE_PATH')
+    numStored: bpy.props.IntProperty()
+    #summary of the last import or reload
+    lastImportTime: bpy.props.FloatProperty()
+    lastImportFPS: bpy.props.FloatProperty()
+    lastImportMB: bpy.props.FloatProperty()
+    lastPeakMemory: bpy.props.FloatProperty()
+    
+    def setFromImporter(self, imp):
+        self.importSettings.obj_global_scale = imp.obj_global_scale
+        self.importSettings.obj_use_groups_as_vgroups = imp.obj_use_groups_as_vgroups
+        self.importSettings.obj_global_clamp_size = imp.obj_global_clamp_size
+        self.importSettings.obj_use_split_objects = imp.obj_use_split_objects
+        self.importSettings.obj_use_split_groups = imp.obj_use_split_groups
+        self.importSettings.stl_global_scale = imp.stl_global_scale
+        self.importSettings.stl_use_scene_unit = imp.stl_use_scene_unit
+        self.importSettings.stl_use_facet_normal = imp.stl_use_facet_normal
+        self.importSettings.ply_global_scale = imp.ply_global_scale
+        self.importSettings.ply_use_scene_unit = imp.ply_use_scene_unit
+        self.importSettings.axis_forward = imp.axis_forward
+        self.importSettings.axis_up = imp.axis_up
+    
+    def checkFileList(self):
+        """ Whether every file of the sequence is still there, from one pass over its folder
+        """
+        found = set(path for path, size, mtime in scanSequence(bpy.path.abspath(self.dirPath), self.filePrefix, self.fileExt))
+        return all(path in found for path in self.fileIndex().paths())
+    
+    def fileIndex(self):
+        """ The files of the sequence, only decoded again after they changed
+        """
+        directory = bpy.path.abspath(self.dirPath)
+        index = fileIndexes.get((self.fileToken, directory))
+        if index is None:
+            index = SequenceIndex.unpack(directory, self.filePattern, self.fileNames, self.fileFrames, self.fileSizes, self.fileTimes)
+            fileIndexes[(self.fileToken, directory)] = index
+        return index
+    
+    def setIndex(self, index):
+        self.filePattern, self.fileNames, self.fileFrames, self.fileSizes, self.fileTimes = index.pack()
+        #drop the decoded index this replaces, whatever folder it was decoded for
+        for key in [key for key in fileIndexes if key[0] == self.fileToken]:
+            del fileIndexes[key]
+        self.fileToken = uuid.uuid4().hex
+        fileIndexes[(self.fileToken, index.directory)] = index
+    
+    def setFiles(self, entries):
+        """ entries are (path, size, mtime_ns) as returned by scanSequence
+        """
+        self.setIndex(SequenceIndex.fromScan(bpy.path.abspath(self.dirPath), entries))
+    
+    def addFile(self, f):
+        #copy so an index that's still in use elsewhere doesn't change
+        index = self.fileIndex()
+        index = SequenceIndex(index.directory, index.frames, index.sizes, index.mtimes, index.pattern,
+                              None if index.names is None else list(index.names))
+        size, mtime = fileStamp(f)
+        index.append(f, size, mtime)
+        self.setIndex(index)
+    
+    def setReadMatrix(self, matrix):
+        self.useReader = matrix is not None
+        if matrix is not None:
+            self.readMatrix = [c for row in matrix for c in row]
+    
+    def setStats(self, summary):
+        self.lastImportTime = summary['seconds']
+        self.lastImportFPS = summary['framesPerSecond']
+        self.lastImportMB = summary['bytesRead']/(1024*1024)
+        self.lastPeakMemory = summary['peakMemory']/(1024*1024)
+    
+    def getReadMatrix(self):
+        if not self.useReader:
+            return None
+        m = self.readMatrix
+        return tuple(tuple(m[4*i:4*i+4]) for i in range(4))
+
+
+class SequenceImportSettings(bpy.types.PropertyGroup):
+    fileNamePrefix: bpy.props.StringProperty(name='File Name')
+    fileFormat: bpy.props.EnumProperty(
+        items = [('obj', 'OBJ', 'Wavefront OBJ'),
+                 ('stl', 'STL', 'StereoLithography'),
+                 ('ply', 'PLY', 'Stanford PLY')],
+        name = 'File Format',
+        default = 'obj')
+    storageMode: bpy.props.EnumProperty(
+        items = [('KEYS', 'Shape Keys', 'One keyframed shape key per frame'),
+                 ('DELTA', 'Sparse Deltas', 'Store only the vertices that move, as offsets from the base mesh in a file next to the sequence. Played back through a single shape key'),
+                 ('PACKED', 'Packed Frames', 'Store every frame as packed positions in a file next to the sequence. Played back through a single shape key, so playback cost does not grow with the number of frames'),
+                 ('LAZY', 'On Demand', 'Only remember the files and read frames while they are played back, keeping a window of frames around the current one in memory. For very long sequences')],
+        name = 'Storage',
+        default = 'KEYS')
+    staticThreshold: bpy.props.FloatProperty(
+        name="Static Threshold",
+        description="Vertices that never move further than this from the base mesh are treated as static and not stored",
+        min=0.0,
+        soft_max=0.01,
+        precision=6,
+        default=1e-6)
+    reduceTolerance: bpy.props.FloatProperty(
+        name="Skip Tolerance",
+        description="Frames where no vertex moved further than this since the last kept frame don't get their own shape key (zero to keep every frame)",
+        min=0.0,
+        soft_max=0.01,
+        precision=6,
+        default=0.0)
+    reduceMode: bpy.props.EnumProperty(
+        items = [('HOLD', 'Hold', 'Keep the previous shape until the next kept frame'),
+                 ('INTERPOLATE', 'Interpolate', 'Blend linearly between the kept frames around skipped ones')],
+        name = 'Skipped Frames',
+        default = 'HOLD')
+    topologyMode: bpy.props.EnumProperty(
+        items = [('ABORT', 'Stop', 'Report where the vertex number changes and import nothing'),
+                 ('SPLIT', 'Split', 'Import each run of frames with the same topology as its own object, shown only during its frames'),
+                 ('SWAP', 'Swap Meshes', 'Rebuild the mesh of the object from the file of the frame shown during playback, keeping a window of frames around the current one in memory')],
+        name = 'Topology Changes',
+        description = 'What to do if the vertex number changes during the sequence, checked before anything is imported',
+        default = 'ABORT')
+
+
+class OBJShapeKeysPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+    
+    numWorkers: bpy.props.IntProperty(
+        name="Parser Processes",
+        description="Number of processes used to read sequence files in parallel (zero to use all but one core)",
+        min=0,
+        max=256,
+        default=0)
+    maxInFlight: bpy.props.IntProperty(
+        name="Frames In Flight",
+        description="Maximum number of frames being read ahead of the shape key creation, limits memory use (zero for twice the number of processes)",
+        min=0,
+        max=4096,
+        default=0)
+    useCache: bpy.props.BoolProperty(
+        name="Cache Parsed Frames",
+        description="Keep the parsed positions of every frame on disk so reloading or reimporting unchanged files skips parsing",
+        default=True)
+    cacheDirectory: bpy.props.StringProperty(
+        name="Cache Folder",
+        description="Where parsed frames are stored (empty to use Blender's user data folder)",
+        subtype='DIR_PATH',
+        default="")
+    cacheSizeLimit: bpy.props.IntProperty(
+        name="Cache Size Limit (MB)",
+        description="Least recently used frames are removed once the cache grows past this size",
+        min=1,
+        default=4096)
+    watchInterval: bpy.props.FloatProperty(
+        name="Live Update Interval",
+        description="Seconds between checks for new files in sequences with live update enabled",
+        min=0.1,
+        max=600.0,
+        default=1.0)
+    windowSize: bpy.props.IntProperty(
+        name="On Demand Window",
+        description="Number of parsed frames kept in memory for sequences loaded on demand",
+        min=1,
+        max=4096,
+        default=32)
+    readAhead: bpy.props.IntProperty(
+        name="On Demand Read Ahead",
+        description="Number of frames read ahead in the playback direction for sequences loaded on demand",
+        min=0,
+        max=4096,
+        default=8)
+    memoryBudget: bpy.props.IntProperty(
+        name="Memory Budget (MB)",
+        description="Memory frames read ahead may take during an import, or kept in the window of sequences loaded on demand. Lowers Frames In Flight and the window size where needed (zero for no limit)",
+        min=0,
+        default=0)
+    storeLocation: bpy.props.EnumProperty(
+        items = [('SEQUENCE', 'Next To Sequence', 'Write frame stores into the folder of the sequence'),
+                 ('BLEND', 'Next To .blend', 'Write frame stores next to the .blend file (the cache folder while it is unsaved)'),
+                 ('CACHE', 'Cache Folder', 'Write frame stores into the cache folder')],
+        name="Frame Store Location",
+        description="Where the .objsk files of the Sparse Deltas and Packed Frames storage modes are written",
+        default='SEQUENCE')
+    logFile: bpy.props.StringProperty(
+        name="Import Log",
+        description="Append timings, throughput and memory use of every import to this file, one JSON line per import (empty to not log)",
+        subtype='FILE_PATH',
+        default="")
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, 'numWorkers')
+        layout.prop(self, 'maxInFlight')
+        layout.prop(self, 'memoryBudget')
+        layout.prop(self, 'useCache')
+        col = layout.column()
+        col.active = self.useCache
+        col.prop(self, 'cacheDirectory')
+        col.prop(self, 'cacheSizeLimit')
+        col.operator(ClearFrameCache.bl_idname)
+        layout.prop(self, 'watchInterval')
+        layout.prop(self, 'windowSize')
+        layout.prop(self, 'readAhead')
+        layout.prop(self, 'storeLocation')
+        layout.prop(self, 'logFile')
+        
+        
+class ReloadMeshSequence(bpy.types.Operator):
+    """Delete and Reload Mesh Sequence"""
+    bl_idname = "objsk.reload_mesh_sequence"
+    bl_label = "Reload Mesh Sequence"
+    bl_options = {'UNDO'}
+    
+    incremental: bpy.props.BoolProperty(
+        name="Only Changed Frames",
+        description="Only reread frames whose files changed, drop removed ones and append new ones",
+        default=False)
+
+    def execute(self, context):
+        obj = context.object
+        # print('Context Object: '+obj.name)
+        if not obj.objsk_settings.initialized:
+            self.report({'INFO'}, "Not an initialized obj shapekeys sequence, skipping")
+            return {'FINISHED'}
+        
+        if self.incremental:
+            result = updateSequence(obj)
+            #None means the change can't be applied in place, fall back to reloading everything
+            if result is not None:
+                meshCount, numRead = result
+                if meshCount == 0:
+                    self.report({'ERROR'}, "No matching files found. Make sure the Root Folder, File Name, and File Format are correct.")
+                    return {'CANCELLED'}
+                if meshCount < 0:
+                    self.report({'ERROR'}, numRead)
+                    return {'CANCELLED'}
+                self.report({'INFO'}, "Updated %d of %d frames" % (numRead, meshCount))
+                return {'FINISHED'}
+        
+        #Check to make sure all files are still there
+        if not obj.objsk_settings.checkFileList():
+            self.report({'ERROR'}, "Files in sequence have been moved or deleted. Please reimport sequence.")
+            return {'CANCELLED'}
+        
+        import_settings = obj.objsk_settings.importSettings
+        
+        #delete object
+#        bpy.data.objects.remove(obj, do_unlink=True)
+        
+        #reimport, together with the other objects read from the same files
+        seqObjs = sequenceObjects(obj)
+        for seqObj in seqObjs:
+            seqObj.objsk_settings.initialized = False
+        forward = import_settings.axis_forward.replace('NEGATIVE_', '-')
+        up = import_settings.axis_up.replace('NEGATIVE_', '-')
+        global_matrix = axis_conversion(from_forward=forward, from_up=up).to_4x4()
+        meshCount, seqObjs = loadSequence(obj.objsk_settings.dirPath, obj.objsk_settings.filePrefix, obj.objsk_settings.fileExt, obj.objsk_settings.importSettings, useObjs=seqObjs,
+                                          storageMode=obj.objsk_settings.storageMode, staticThreshold=obj.objsk_settings.staticThreshold,
+                                          reduceTolerance=obj.objsk_settings.reduceTolerance, reduceMode=obj.objsk_settings.reduceMode,
+                                          topologyMode=obj.objsk_settings.topologyMode, frameOffset=obj.objsk_settings.frameOffset,
+                                          frameRange=tuple(obj.objsk_settings.frameRange) if obj.objsk_settings.useFrameRange else None)
+        if meshCount == 0:
+            self.report({'ERROR'}, "No matching files found. Make sure the Root Folder, File Name, and File Format are correct.")
+            return {'CANCELLED'}
+        if meshCount < 0:
+            #use the other return as the string, bit of a hack
+            self.report({'ERROR'}, seqObjs)
+            return {'CANCELLED'}
+        
+        for seqObj in seqObjs:
+            if seqObj.objsk_settings.fileExt in pointcache.FORMATS:
+                #point caches are loaded onto a mesh that keeps its own transform
+                continue
+            seqObj.matrix_world = global_matrix
+            #update name
+#            meshName = os.path.splitext(seqObj.name)[0].rstrip('._0123456789')
+#            seqObj.name = meshName + '_shapekeys'
+        #set the frame to the start
+        context.scene.frame_set(1)
+        
+
+        return {'FINISHED'}
+
+
+class WatchMeshSequence(bpy.types.Operator):
+    """Start or stop adding new frames to the sequence as they're written to its folder"""
+    bl_idname = "objsk.watch_mesh_sequence"
+    bl_label = "Live Update"
+
+    def execute(self, context):
+        obj = context.object
+        if not obj.objsk_settings.initialized:
+            self.report({'INFO'}, "Not an initialized obj shapekeys sequence, skipping")
+            return {'FINISHED'}
+        if obj.name in sequenceWatchers:
+            sequenceWatchers.pop(obj.name).stop()
+            return {'FINISHED'}
+        settings = obj.objsk_settings
+        if settings.storageMode != 'KEYS' or settings.reduceTolerance > 0.0:
+            self.report({'ERROR'}, "Live update only works for sequences stored as one shape key per frame.")
+            return {'CANCELLED'}
+        if len(sequenceObjects(obj)) > 1 or settings.useFrameRange:
+            self.report({'ERROR'}, "Live update only works for sequences with a single mesh that weren't split.")
+            return {'CANCELLED'}
+        readMatrix = settings.getReadMatrix()
+        if readMatrix is None:
+            self.report({'ERROR'}, "Live update needs files that can be read without the importer (single object, no clamping).")
+            return {'CANCELLED'}
+        signature = readerSignature(settings.importSettings, settings.fileExt, readMatrix)
+        sequenceWatchers[obj.name] = FolderWatcher(bpy.path.abspath(settings.dirPath), settings.filePrefix, settings.fileExt,
+                                                   settings.fileIndex().paths(), frameKey, readMatrix, getFrameCache(), signature)
+        if not bpy.app.timers.is_registered(watchSequences):
+            bpy.app.timers.register(watchSequences, first_interval=getPreferences().watchInterval)
+        return {'FINISHED'}
+
+
+class ExportPointCache(bpy.types.Operator, ExportHelper):
+    """Write every frame of the sequence to a PC2 or MDD point cache"""
+    bl_idname = "objsk.export_point_cache"
+    bl_label = "Export Point Cache"
+    
+    filename_ext = ".pc2"
+    filter_glob: bpy.props.StringProperty(default="*.pc2;*.mdd", options={'HIDDEN'})
+    fileFormat: bpy.props.EnumProperty(
+        items = [('pc2', 'PC2', 'Little endian point cache with start frame and sample rate'),
+                 ('mdd', 'MDD', 'Big endian point cache with a time per frame')],
+        name = 'Format',
+        default = 'pc2')
+    
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj is not None and obj.type == 'MESH' and obj.data.shape_keys is not None and obj.objsk_settings.storageMode != 'SWAP'
+    
+    def execute(self, context):
+        obj = context.object
+        path = bpy.path.ensure_ext(os.path.splitext(self.filepath)[0], '.'+self.fileFormat)
+        numFrames, frames = sequenceFrames(obj)
+        if numFrames == 0:
+            self.report({'ERROR'}, "The frames of this sequence can't be read.")
+            return {'CANCELLED'}
+        try:
+            pointcache.writePointCache(path, frames, len(obj.data.vertices), numFrames, fps=context.scene.render.fps/context.scene.render.fps_base)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Wrote %d frames to %s" % (numFrames, path))
+        return {'FINISHED'}
+
+
+class ImportPointCache(bpy.types.Operator, ImportHelper):
+    """Load a PC2 or MDD point cache as shape keys of the selected mesh"""
+    bl_idname = "objsk.import_point_cache"
+    bl_label = "Import Point Cache"
+    bl_options = {'UNDO'}
+    
+    filter_glob: bpy.props.StringProperty(default="*.pc2;*.mdd", options={'HIDDEN'})
+    storageMode: bpy.props.EnumProperty(
+        items = [('KEYS', 'Shape Keys', 'One keyframed shape key per frame'),
+                 ('LAZY', 'From Cache', 'Play back straight from the cache file through a single shape key')],
+        name = 'Storage',
+        default = 'KEYS')
+    
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'MESH' and context.mode == 'OBJECT'
+    
+    def execute(self, context):
+        obj = context.object
+        directory, name = os.path.split(self.filepath)
+        file, ext = os.path.splitext(name)
+        meshCount, seqObjs = loadSequence(directory, file, ext[1:].lower(), obj.objsk_settings.importSettings, useObjs=[obj], storageMode=self.storageMode)
+        if meshCount == 0:
+            self.report({'ERROR'}, "%s not found." % self.filepath)
+            return {'CANCELLED'}
+        if meshCount < 0:
+            self.report({'ERROR'}, seqObjs)
+            return {'CANCELLED'}
+        context.scene.frame_set(1)
+        return {'FINISHED'}
+
+
+class ClearFrameCache(bpy.types.Operator):
+    """Delete all cached frame positions"""
+    bl_idname = "objsk.clear_cache"
+    bl_label = "Clear Cache"
+
+    def execute(self, context):
+        freed = FrameCache(getCacheDirectory(), 0).clear()
+        self.report({'INFO'}, "Cleared %.1f MB of cached frames" % (freed/(1024*1024)))
+        return {'FINISHED'}
+
+
+class OBJShapeKeysPanel(bpy.types.Panel):
+    """Creates a Panel in the scene context of the properties editor"""
+    bl_label = "OBJ Shape Keys"
+    bl_idname = "OBJSK_PT_properties"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "object"
+    
+    @classmethod
+    def poll(cls, context):
+        return context.object.type == 'MESH' and context.object.objsk_settings.initialized == True
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.object
+        
+        row = layout.row()
+        row.label(text="Number of frames: " + str(obj.objsk_settings.numMeshes))
+        if obj.objsk_settings.storageMode == 'DELTA':
+            row = layout.row()
+            row.label(text="Moving vertices: %d of %d" % (obj.objsk_settings.numStored, len(obj.data.vertices)))
+        elif obj.objsk_settings.storageMode in ('LAZY', 'SWAP'):
+            row = layout.row()
+            row.label(text="Loaded on demand, %d frames in memory" % getPreferences().windowSize)
+        elif obj.objsk_settings.reduceTolerance > 0.0 and obj.data.shape_keys is not None:
+            row = layout.row()
+            row.label(text="Shape keys: %d" % (len(obj.data.shape_keys.key_blocks)-1))
+        if obj.objsk_settings.lastImportTime > 0.0:
+            col = layout.column(align=True)
+            col.label(text="Last import: %.2fs, %.1f frames/s" % (obj.objsk_settings.lastImportTime, obj.objsk_settings.lastImportFPS))
+            col.label(text="Read %.1f MB, peak memory %.1f MB" % (obj.objsk_settings.lastImportMB, obj.objsk_settings.lastPeakMemory))
+        row = layout.row()
+        row.operator(ReloadMeshSequence.bl_idname)
+        if obj.objsk_settings.storageMode != 'SWAP':
+            row = layout.row()
+            row.operator(ExportPointCache.bl_idname)
+        if obj.objsk_settings.storageMode != 'KEYS':
+            return
+        row = layout.row()
+        row.operator(ReloadMeshSequence.bl_idname, text="Update Changed Frames").incremental = True
+        if obj.objsk_settings.reduceTolerance > 0.0:
+            return
+        row = layout.row()
+        if obj.name in sequenceWatchers:
+            row.operator(WatchMeshSequence.bl_idname, text="Stop Live Update", icon='PAUSE')
+        else:
+            row.operator(WatchMeshSequence.bl_idname, text="Start Live Update", icon='PLAY')
+        
+        
+def readerSignature(fileImporter, fileExt, readMatrix, objects=None):
+    """ Everything that changes what the positions-only reader returns, for the frame cache
+    """
+    if objects is None:
+        return repr((fileImporter.geometrySettings(fileExt), readMatrix))
+    return repr((fileImporter.geometrySettings(fileExt), readMatrix, objects))
+
+def sequenceObjects(obj):
+    """ Every object imported from the same sequence as obj
+    """
+    sequenceId = obj.objsk_settings.sequenceId
+    if not sequenceId:
+        return [obj]
+    return [other for other in bpy.data.objects if other.objsk_settings.sequenceId == sequenceId]
+
+def objectKey(obj, filePath):
+    """ Name of the OBJ object or group an imported object was made from, used to match objects across frames.
+        The importer names objects without one after the file, those get ''
+    """
+    name = re.sub(r'\.[0-9]{3}$', '', obj.name)
+    return '' if name == os.path.splitext(os.path.basename(filePath))[0] else name
+
+def positionReaderMatrix(fileImporter, fileExt, baseObjs, baseFile, objects=None):
+    """ Check whether the positions-only reader gives the same vertices as the importer did for the base file.
+        objects is passed on to meshio.readPositions for files with several objects.
+        Returns the matrix to pass to meshio.readPositions, or None if every frame has to go through the importer
+    """
+    if fileExt == 'obj' and fileImporter.obj_global_clamp_size > 0.0:
+        #clamping depends on the bounds of each frame
+        return None
+    #the importers either bake the conversion into the vertices or put it on the object, only the rest ends up in mesh space
+    baseObj = baseObjs[0]
+    for other in baseObjs[1:]:
+        if any(abs(a - b) > 1e-6 for rowA, rowB in zip(other.matrix_basis, baseObj.matrix_basis) for a, b in zip(rowA, rowB)):
+            return None
+    matrix = baseObj.matrix_basis.inverted() @ fileImporter.importMatrix(fileExt)
+    matrix = tuple(tuple(row) for row in matrix)
+    coords = meshio.readPositions(fileExt, baseFile, matrix, objects)
+    if coords is None or len(coords) != 3*sum(len(obj.data.vertices) for obj in baseObjs):
+        #the importer drops vertices that no face uses, and vertices may be listed under another object than the one using them
+        return None
+    baseCoords = array('f')
+    for obj in baseObjs:
+        baseCoords.extend(getVertexCoords(obj.data))
+    for a, b in zip(coords, baseCoords):
+        if abs(a - b) > 1e-4*(1.0 + abs(b)):
+            return None
+    return matrix
+
+def importFrameCoords(fileImporter, fileExt, filePath, stats=None):
+    """ Import a file with the regular importer, then return (objectKey, vertex positions) of every object in it
+        and delete the imported objects with all their data right away
+    """
+    deselectAll()
+    fileImporter.load(fileExt, filePath, stats, geometryOnly=True)
+    frameObjs = bpy.context.selected_objects
+    frameCoords = [(objectKey(obj, filePath), getVertexCoords(obj.data)) for obj in frameObjs]
+    removeImported(frameObjs)
+    return frameCoords
+
+def splitCoords(coords, objSizes):
+    """ Split the concatenated positions of several objects into one array per object
+    """
+    if len(objSizes) == 1:
+        return [coords]
+    coords = np.frombuffer(coords, dtype=np.float32)
+    ends = 3*np.cumsum(objSizes)
+    return [coords[end-3*size:end] for size, end in zip(objSizes, ends)]
+
+def setFrameRange(settings, topologyMode, frameRange, frameOffset):
+    settings.topologyMode = topologyMode
+    settings.useFrameRange = frameRange is not None
+    if frameRange is not None:
+        settings.frameRange = frameRange
+    settings.frameOffset = frameOffset
+
+def showFrameRange(objs, first, last, fromStart, toEnd):
+    """ Keyframe the visibility of objs so they're only shown from frame first to last.
+        The first part of a sequence also shows before its start, the last one after its end
+    """
+    keys = [(first, False)]
+    if not fromStart:
+        keys.append((first-1, True))
+    if not toEnd:
+        keys.append((last+1, True))
+    for obj in objs:
+        for frame, hidden in keys:
+            obj.hide_viewport = hidden
+            obj.hide_render = hidden
+            obj.keyframe_insert('hide_viewport', frame=frame)
+            obj.keyframe_insert('hide_render', frame=frame)
+
+def loadMeshSwap(dir, file, fileExt, fileImporter, entries, useObjs=None, topologyMode='SWAP', frameRange=None, frameOffset=0):
+    """ Import the first file as the mesh of the object, the playback handler rebuilds it from the file of the
+        frame shown (see swapMesh), so only a window of frames is ever in memory. For sequences whose topology
+        changes, returns the same as loadSequence
+    """
+    import_files = [path for path, size, mtime in entries]
+    deselectAll()
+    #on reload the object keeps its materials, the imported frame is only needed to check the reader
+    fileImporter.load(fileExt, import_files[0], geometryOnly=useObjs is not None)
+    frameObjs = bpy.context.selected_objects
+    if len(frameObjs) != 1:
+        removeImported(frameObjs)
+        return (-1, "Swapping meshes only works for sequences with a single mesh at this time.")
+    readMatrix = positionReaderMatrix(fileImporter, fileExt, frameObjs, import_files[0])
+    frameMesh = pipeline.readMesh(fileExt, import_files[0], readMatrix) if readMatrix is not None else None
+    baseMesh = frameObjs[0].data
+    if frameMesh is None or len(frameMesh.faceSizes) != len(baseMesh.polygons) or len(frameMesh.faceIndices) != len(baseMesh.loops):
+        removeImported(frameObjs)
+        return (-1, "Swapping meshes needs files that can be read without the importer (single object, no clamping).")
+    if useObjs is None:
+        seqObj = frameObjs[0]
+    else:
+        seqObj = useObjs[0]
+        removeImported(frameObjs)
+        closeStore(seqObj.name)
+        fillMesh(seqObj.data, frameMesh)
+    settings = seqObj.objsk_settings
+    if useObjs is None:
+        settings.setFromImporter(fileImporter)
+    settings.dirPath = dir
+    settings.fileExt = fileExt
+    settings.filePrefix = file
+    settings.setFiles(entries)
+    settings.setReadMatrix(readMatrix)
+    settings.sequenceId = uuid.uuid4().hex
+    settings.storageMode = 'SWAP'
+    setFrameRange(settings, topologyMode, frameRange, frameOffset)
+    settings.numMeshes = len(import_files)
+    settings.initialized = True
+    return (len(import_files), [seqObj])
+
+def loadPointCache(dir, file, fileExt, useObjs, storageMode='KEYS', reduceTolerance=0.0, reduceMode='HOLD', stats=None):
+    """ Load the PC2 or MDD file dir/file.fileExt onto an existing object, its first frame becomes the Basis.
+        Shape keys are filled straight from the memory-mapped file. Returns the same as loadSequence
+    """
+    if stats is None:
+        stats = ImportStats()
+    if useObjs is None or len(useObjs) != 1:
+        return (-1, "Point caches have no topology of their own, they're loaded onto the selected mesh.")
+    obj = useObjs[0]
+    path = os.path.join(bpy.path.abspath(dir), file+'.'+fileExt)
+    if not os.path.isfile(path):
+        return (0, None)
+    try:
+        cache = pointcache.PointCache(path)
+    except (OSError, ValueError) as e:
+        return (-1, str(e))
+    if cache.numFrames == 0:
+        return (-1, "%s has no frames" % path)
+    if cache.numVerts != len(obj.data.vertices):
+        return (-2, "%s has a different vertex number (%d) than %s (%d)" % (path, cache.numVerts, obj.name, len(obj.data.vertices)))
+    closeStore(obj.name)
+    obj.shape_key_clear()
+    obj.data.vertices.foreach_set('co', cache.positions(0))
+    obj.data.update()
+    sk_basis = obj.shape_key_add(name='Basis', from_mix=False)
+    sk_basis.interpolation = 'KEY_LINEAR'
+    obj.data.shape_keys.use_relative = True
+    stats.addFrame(path, 0.0, cache.numVerts)
+    keyFrames = [1]
+    if storageMode == 'KEYS':
+        lastKept = cache.positions(0)
+        for i in range(1, cache.numFrames):
+            frameStart = time.perf_counter()
+            coords = cache.positions(i)
+            if reduceTolerance > 0.0:
+                if np.abs(coords - lastKept).max() <= reduceTolerance:
+                    continue
+                lastKept = coords
+            keyFrames.append(i+1)
+            with stats.phase('shape_keys'):
+                sk = obj.shape_key_add(name='Frame '+str(i), from_mix=False)
+                sk.interpolation = 'KEY_LINEAR'
+            with stats.phase('transfer'):
+                sk.data.foreach_set('co', coords)
+            stats.verticesTransferred += cache.numVerts
+            stats.frames.append((path, time.perf_counter() - frameStart))
+        with stats.phase('keyframing'):
+            keyframeShapeKeys(obj, keyFrames=keyFrames, interpolate=reduceMode == 'INTERPOLATE')
+    else:
+        #played back from the cache itself
+        storageMode = 'LAZY'
+        sk = obj.shape_key_add(name='Sequence', from_mix=False)
+        sk.value = 1.0
+    cache.close()
+    settings = obj.objsk_settings
+    settings.dirPath = dir
+    settings.fileExt = fileExt
+    settings.filePrefix = file
+    st = os.stat(path)
+    settings.setFiles([(path, st.st_size, st.st_mtime_ns)])
+    settings.setReadMatrix(None)
+    settings.objectName = ''
+    settings.sequenceId = uuid.uuid4().hex
+    settings.storageMode = storageMode
+    settings.reduceTolerance = reduceTolerance
+    settings.reduceMode = reduceMode
+    setFrameRange(settings, 'ABORT', None, 0)
+    settings.numMeshes = cache.numFrames
+    settings.initialized = True
+    stats.bytesRead = st.st_size
+    settings.setStats(stats.finish())
+    return (cache.numFrames, [obj])
+
+def keyFramesOf(obj):
+    """ Frame each shape key is active on, read back from the F-curves keyframeShapeKeys wrote (the first
+        keyframe with a value of one). Keys without one are taken to follow the key before them
+    """
+    key = obj.data.shape_keys
+    action = key.animation_data.action if key.animation_data is not None else None
+    keyFrames = []
+    for i, sk in enumerate(key.key_blocks):
+        frame = None
+        if sk != key.reference_key and action is not None:
+            fcurve = action.fcurves.find('key_blocks["%s"].value' % bpy.utils.escape_identifier(sk.name))
+            if fcurve is not None:
+                active = [point.co[0] for point in fcurve.keyframe_points if point.co[1] == 1.0]
+                if len(active) > 0:
+                    frame = int(round(min(active)))
+        if frame is None:
+            frame = keyFrames[-1]+1 if len(keyFrames) > 0 else 1+obj.objsk_settings.frameOffset
+        keyFrames.append(frame)
+    return keyFrames
+
+def sequenceFrames(obj):
+    """ Number of frames of an imported sequence and an iterator over their flat float32 positions, one per
+        timeline frame, from the shape keys or from the frame store the sequence is played back from.
+        Frames left out with a skip tolerance are held or blended like during playback
+    """
+    settings = obj.objsk_settings
+    key = obj.data.shape_keys
+    numVerts = len(obj.data.vertices)
+    if settings.storageMode == 'KEYS':
+        blocks = list(key.key_blocks)
+        keyFrames = keyFramesOf(obj)
+        first = keyFrames[0]
+        numFrames = max(settings.numMeshes, keyFrames[-1]-first+1)
+        interpolate = settings.reduceMode == 'INTERPOLATE'
+        def frames():
+            #at most the two keys around the current frame are held, each read with one bulk call
+            loaded = {}
+            def positions(i):
+                if i not in loaded:
+                    if len(loaded) >= 2:
+                        del loaded[min(loaded)]
+                    coords = np.empty(3*numVerts, dtype=np.float32)
+                    blocks[i].data.foreach_get('co', coords)
+                    loaded[i] = coords
+                return loaded[i]
+            k = 0
+            for frame in range(first, first+numFrames):
+                while k+1 < len(blocks) and keyFrames[k+1] <= frame:
+                    k += 1
+                if interpolate and k+1 < len(blocks) and keyFrames[k] < frame:
+                    w = (frame-keyFrames[k])/(keyFrames[k+1]-keyFrames[k])
+                    yield ((1.0-w)*positions(k) + w*positions(k+1)).astype(np.float32)
+                else:
+                    yield positions(k)
+        return (numFrames, frames())
+    entry = getFrameStore(obj)
+    if entry is None:
+        return (0, iter(()))
+    path, store, base, lastIndex = entry
+    def frames():
+        yield base.ravel()
+        for i in range(store.numFrames):
+            coords = store.positions(i, base)
+            if coords is None:
+                raise ValueError("Frame %d of the sequence can't be read" % (i+2))
+            yield coords
+    return (store.numFrames+1, frames())
+
+def keyframeShapeKeys(obj, first=1, keyFrames=None, interpolate=False):
+    """ Build the F-curve of every shape key's value directly. keyFrames is the frame each key is active on,
+        starting with the Basis on frame 1 (by default the ith key is active on frame i+1).
+        Where frames were left out between two keys, the earlier key is held until the next one, or with
+        interpolate set the two are blended linearly across the gap.
+        Each key gets at most four keyframes, written in one call. Keys before index first are left as they are
+    """
+    key = obj.data.shape_keys
+    numKeys = len(key.key_blocks)
+    if keyFrames is None:
+        keyFrames = list(range(1, numKeys+1))
+    if key.animation_data is None:
+        key.animation_data_create()
+    action = key.animation_data.action
+    if action is None:
+        action = bpy.data.actions.new(name=key.name+'Action')
+        key.animation_data.action = action
+    for i, sk in enumerate(key.key_blocks):
+        if sk == key.reference_key or i < first:
+            continue
+        dataPath = 'key_blocks["%s"].value' % bpy.utils.escape_identifier(sk.name)
+        fcurve = action.fcurves.find(dataPath)
+        if fcurve is not None:
+            action.fcurves.remove(fcurve)
+        fcurve = action.fcurves.new(dataPath)
+        #(frame, value) pairs, the last key stays active after the end of the sequence
+        frame = keyFrames[i]
+        if interpolate:
+            points = [(keyFrames[i-1], 0.0), (frame, 1.0)]
+            if i+1 < numKeys:
+                points.append((keyFrames[i+1], 0.0))
+        else:
+            points = [(frame-1, 0.0), (frame, 1.0)]
+            if i+1 < numKeys:
+                if keyFrames[i+1]-1 > frame:
+                    points.append((keyFrames[i+1]-1, 1.0))
+                points.append((keyFrames[i+1], 0.0))
+        fcurve.keyframe_points.add(len(points))
+        fcurve.keyframe_points.foreach_set('co', [c for p in points for c in p])
+        if interpolate:
+            for point in fcurve.keyframe_points:
+                point.interpolation = 'LINEAR'
+        fcurve.update()
+
+def loadSequence(dir, file, fileExt, fileImporter, useObjs=None, storageMode='KEYS', staticThreshold=0.0, reduceTolerance=0.0, reduceMode='HOLD', stats=None,
+                 topologyMode='ABORT', frameRange=None, frameOffset=0):
+    if stats is None:
+        stats = ImportStats()
+    if fileExt in pointcache.FORMATS:
+        return loadPointCache(dir, file, fileExt, useObjs, storageMode, reduceTolerance, reduceMode, stats)
+    full_dir = bpy.path.abspath(dir)
+    with stats.phase('scan'):
+        entries = scanSequence(full_dir, file, fileExt)
+    if frameRange is not None:
+        #one part of a sequence that was split where its topology changes, as first and last index into the
+        #sorted files (frame numbers can repeat or be missing)
+        entries = entries[frameRange[0]:frameRange[1]+1]
+    import_files = [path for path, size, mtime in entries]
+    if len(import_files) == 0:
+        print('No files found with search')
+        print('dir: '+full_dir)
+        print('path: '+os.path.join(full_dir, file+'*.'+fileExt))
+        return (0, None)
+    numFiles = len(import_files)
+    
+    #check the topology of every file up front, so a change doesn't abort the import halfway through.
+    #Parts of a split sequence were already checked when they're first imported. On demand sequences don't
+    #read any frame at import, frames with a different vertex number are skipped during playback instead.
+    #Swapped meshes don't need the same topology anyway
+    runs = [(0, numFiles)]
+    if storageMode not in ('LAZY', 'SWAP') and (frameRange is None or useObjs is not None):
+        with stats.phase('topology_scan'):
+            counts = pipeline.readVertexCounts(fileExt, import_files, getPreferences().numWorkers)
+        runs = pipeline.topologyRuns(counts)
+    if storageMode == 'SWAP' or (len(runs) > 1 and topologyMode == 'SWAP'):
+        return loadMeshSwap(dir, file, fileExt, fileImporter, entries, useObjs, topologyMode, frameRange, frameOffset)
+    if len(runs) > 1:
+        changes = ', '.join('%s (%d)' % (os.path.basename(import_files[start]), counts[start]) for start, end in runs[1:])
+        if topologyMode != 'SPLIT' or useObjs is not None:
+            return (-2, "The vertex number changes during the sequence, at %s. Pick a different Topology Changes option to import it." % changes)
+        print('Splitting sequence where its vertex number changes: ' + changes)
+        seqObjs = []
+        for start, end in runs:
+            partRange = (start, end-1)
+            meshCount, objs = loadSequence(dir, file, fileExt, fileImporter, storageMode=storageMode, staticThreshold=staticThreshold,
+                                           reduceTolerance=reduceTolerance, reduceMode=reduceMode, topologyMode=topologyMode,
+                                           frameRange=partRange, frameOffset=frameOffset+start)
+            if meshCount <= 0:
+                return (meshCount, objs)
+            showFrameRange(objs, frameOffset+start+1, frameOffset+end, start == 0, end == numFiles)
+            seqObjs.extend(objs)
+        return (numFiles, seqObjs)
+    if storageMode == 'LAZY' and fileExt == 'obj' and fileImporter.obj_global_clamp_size > 0.0:
+        return (-1, "Loading frames on demand needs files that can be read without the importer (single object, no clamping).")
+    if storageMode != 'KEYS' and useObjs is not None and len(useObjs) > 1:
+        return (-1, "Frame stores only support sequences with a single mesh at this time.")
+    #setup progress
+    wm = bpy.context.window_manager
+    # half for import, half for keyframing
+    wm.progress_begin(0, 2*len(import_files))
+    
+    deselectAll()
+    objSizes = []
+    baseStart = time.perf_counter()
+    #on reload the existing objects keep their materials, only the positions are needed
+    fileImporter.load(fileExt, import_files[0], stats, geometryOnly=useObjs is not None)
+    baseObjs = bpy.context.selected_objects # get newly imported 
+    #objects of later frames are matched to these by the name of the OBJ object or group they come from
+    keys = [objectKey(obj, import_files[0]) for obj in baseObjs]
+    objects = (keys, fileImporter.obj_use_split_groups) if len(baseObjs) > 1 else None
+    with stats.phase('reader_check'):
+        readMatrix = positionReaderMatrix(fileImporter, fileExt, baseObjs, import_files[0], objects)
+    #everything that can still fail is checked before the scene is changed, the imported base is removed again
+    error = None
+    matched = None
+    if storageMode != 'KEYS' and len(baseObjs) > 1:
+        error = (-1, "Frame stores only support sequences with a single mesh at this time.")
+    elif storageMode == 'LAZY' and readMatrix is None:
+        error = (-1, "Loading frames on demand needs files that can be read without the importer (single object, no clamping).")
+    elif useObjs is not None:
+        if len(useObjs) == 1 and len(baseObjs) == 1:
+            matched = baseObjs
+        else:
+            matched = meshio.matchObjects([obj.objsk_settings.objectName for obj in useObjs], zip(keys, baseObjs))
+        if matched is None:
+            error = (-1, "%s doesn't contain every object of the sequence anymore." % import_files[0])
+        else:
+            for useObj, baseObj in zip(useObjs, matched):
+                if len(baseObj.data.vertices) != len(useObj.data.vertices):
+                    error = (-2, "Imported object in %s has difference vertex number (%d) than the existing object (%d)" % (import_files[0], len(baseObj.data.vertices), len(useObj.data.vertices)))
+                    break
+    if error is None:
+        for ind, baseObj in enumerate(baseObjs):
+            if len(baseObj.data.vertices) == 0:
+                error = (-1, "Imported object %d in %s has 0 vertices" % (ind+1, import_files[0]))
+                break
+    if error is None and storageMode != 'KEYS' and useObjs is not None:
+        #the store being replaced may still be open for playback
+        closeStore(useObjs[0].name)
+    writer = None
+    if error is None and storageMode in ('DELTA', 'PACKED'):
+        #frames go into a frame store instead of shape keys
+        storePath = storeFilePath(full_dir, file, frameRange)
+        try:
+            os.makedirs(os.path.dirname(storePath), exist_ok=True)
+            writer = FrameStoreWriter(storePath, getVertexCoords(baseObjs[0].data), staticThreshold, sparse=storageMode == 'DELTA')
+        except OSError as e:
+            error = (-1, "Can't write the frame store %s (%s). Pick another Frame Store Location in the addon preferences." % (storePath, e.strerror or e))
+    if error is not None:
+        removeImported(baseObjs)
+        wm.progress_end()
+        return error
+    if useObjs is not None:
+        #copy vertices from imported base into the existing objects just in case they're different
+        for useObj, baseObj in zip(useObjs, matched):
+            useObj.shape_key_clear()
+            useObj.data.vertices.foreach_set('co', getVertexCoords(baseObj.data))
+            useObj.data.update()
+        removeImported(baseObjs)
+        baseObjs = list(useObjs)
+        keys = [obj.objsk_settings.objectName for obj in baseObjs]
+        objects = (keys, fileImporter.obj_use_split_groups) if len(baseObjs) > 1 else None
+    for ind, baseObj in enumerate(baseObjs):
+        verts = baseObj.data.vertices # get vertices obj
+        objSizes.append(len(verts))
+        sk_basis = baseObj.shape_key_add(name='Basis', from_mix=False) # create base shape key
+        sk_basis.interpolation = 'KEY_LINEAR'
+        baseObj.data.shape_keys.use_relative = True
+    stats.addFrame(import_files[0], time.perf_counter() - baseStart, sum(objSizes))
+    #frame each shape key is active on and the positions of the last kept frame, per object
+    keyFrames = [[1+frameOffset] for baseObj in baseObjs]
+    lastKept = [np.frombuffer(getVertexCoords(baseObj.data), dtype=np.float32) for baseObj in baseObjs]
+    #every object of the sequence gets the full settings, so any of them can reload the whole sequence
+    sequenceId = uuid.uuid4().hex
+    for ind, obj in enumerate(baseObjs):
+        settings = obj.objsk_settings
+        if useObjs is None:
+            settings.setFromImporter(fileImporter)
+        settings.dirPath = dir
+        settings.fileExt = fileExt
+        settings.filePrefix = file
+        settings.setFiles(entries)
+        settings.setReadMatrix(readMatrix)
+        settings.objectName = keys[ind]
+        settings.sequenceId = sequenceId
+        setFrameRange(settings, topologyMode, frameRange, frameOffset)
+    import_files.pop(0) # remove first element
+
+    #for each remaining file, read the vertex positions and create shape key
+    #files are parsed ahead in worker processes, only the shape key writes happen here
+    if storageMode == 'LAZY':
+        #frames are only read once they're played back
+        frames = ()
+    elif readMatrix is not None:
+        signature = readerSignature(fileImporter, fileExt, readMatrix, objects)
+        numWorkers, maxInFlight = readAheadLimits(sum(objSizes), entries[0][1])
+        frames = pipeline.readFrames(fileExt, import_files, readMatrix, numWorkers, maxInFlight, getFrameCache(), signature, objects)
+    else:
+        frames = ((f, None) for f in import_files)
+    frame = 1
+    frameStart = time.perf_counter()
+    #time spent waiting on the readers counts as parsing
+    for f, coords in stats.timed(frames, 'parse'):
+        if coords is not None and len(baseObjs) > 1 and len(coords) != 3*sum(objSizes):
+            #let the importer tell which object changed
+            coords = None
+        if coords is not None:
+            frameCoords = splitCoords(coords, objSizes)
+        else:
+            imported = importFrameCoords(fileImporter, fileExt, f, stats)
+            if len(baseObjs) == 1 and len(imported) == 1:
+                frameCoords = [imported[0][1]]
+            else:
+                frameCoords = meshio.matchObjects(keys, imported)
+            if frameCoords is None:
+                if writer is not None:
+                    writer.abort()
+                return (-2, "%s doesn't contain every object of the base file (%s)" % (f, ', '.join(key or 'unnamed' for key in keys)))
+        for ind, coords in enumerate(frameCoords):
+            numVerts = len(coords)//3
+            if numVerts == 0 or numVerts != objSizes[ind]:
+                if writer is not None:
+                    writer.abort()
+            if numVerts == 0:
+                return (-1, "Imported object %d in %s has 0 vertices" % (ind+1, f))
+            if numVerts != objSizes[ind]:
+                return (-2, "Imported object %d in %s has difference vertex number (%d) than base object (%d)" % (ind+1, f, numVerts, objSizes[ind]))
+            if writer is not None:
+                with stats.phase('transfer'):
+                    writer.add(coords)
+                continue
+            if reduceTolerance > 0.0:
+                #skip frames that are within tolerance of the last kept one
+                frameArray = np.frombuffer(coords, dtype=np.float32)
+                if np.abs(frameArray - lastKept[ind]).max() <= reduceTolerance:
+                    continue
+                lastKept[ind] = frameArray
+            keyFrames[ind].append(frame+1+frameOffset)
+            # create new shake key
+            with stats.phase('shape_keys'):
+                sk = baseObjs[ind].shape_key_add(name='Frame '+str(frame), from_mix=False)
+                sk.interpolation = 'KEY_LINEAR'
+            #copy all vertex positions into the shape key in one call
+            with stats.phase('transfer'):
+                sk.data.foreach_set('co', coords)
+        stats.addFrame(f, time.perf_counter() - frameStart, sum(len(coords)//3 for coords in frameCoords))
+        frameStart = time.perf_counter()
+        frame += 1
+        wm.progress_update(frame)
+    
+    for obj in baseObjs:
+        settings = obj.objsk_settings
+        settings.storageMode = storageMode
+        settings.staticThreshold = staticThreshold
+        settings.reduceTolerance = reduceTolerance
+        settings.reduceMode = reduceMode
+    settings = baseObjs[0].objsk_settings
+    if storageMode != 'KEYS':
+        if writer is not None:
+            with stats.phase('store_close'):
+                settings.numStored = writer.close()
+            settings.storePath = storePath
+        else:
+            #nothing was read yet, every file is still a frame
+            frame = numFiles
+        #the playback handler writes the current frame into this key
+        sk = baseObjs[0].shape_key_add(name='Sequence', from_mix=False)
+        sk.value = 1.0
+    else:
+        #add keyframes for shape keys for each frame
+        with stats.phase('keyframing'):
+            for ind, obj in enumerate(baseObjs):
+                keyframeShapeKeys(obj, keyFrames=keyFrames[ind], interpolate=reduceMode == 'INTERPOLATE')
+    wm.progress_update(2*frame)
+    wm.progress_end()
+    for obj in baseObjs:
+        obj.objsk_settings.numMeshes = numFiles
+        obj.objsk_settings.initialized = True
+    with stats.phase('orphan_purge'):
+        if bpy.ops.outliner.orphans_purge.poll():
+            bpy.ops.outliner.orphans_purge()
+    summary = stats.finish()
+    for obj in baseObjs:
+        obj.objsk_settings.setStats(summary)
+    logFile = getPreferences().logFile
+    if logFile:
+        try:
+            stats.writeLog(bpy.path.abspath(logFile), directory=full_dir, prefix=file, format=fileExt, storage=storageMode, vertices=sum(objSizes))
+        except OSError as e:
+            print('Could not write import log %s: %s' % (logFile, e))
+    return (frame, baseObjs)
+
+
+def updateSequence(obj):
+    """ Bring an imported sequence up to date with its folder without rebuilding it: shape keys of changed files
+        are reread in place, keys of removed files are dropped and new files after the last one are appended.
+        Returns (number of frames, number of frames read), (0, None) if no files match anymore or
+        (negative, error message) like loadSequence. Returns None if the change needs a full reload
+    """
+    settings = obj.objsk_settings
+    if settings.storageMode != 'KEYS' or settings.reduceTolerance > 0.0:
+        #shape keys don't map one to one onto files
+        return None
+    if len(sequenceObjects(obj)) > 1 or settings.useFrameRange or settings.fileExt in pointcache.FORMATS:
+        #objects sharing the files get reloaded together, parts of a split sequence can't grow and
+        #point caches are a single file
+        return None
+    fileImporter = settings.importSettings
+    fileExt = settings.fileExt
+    full_dir = bpy.path.abspath(settings.dirPath)
+    entries = scanSequence(full_dir, settings.filePrefix, fileExt)
+    if len(entries) == 0:
+        return (0, None)
+    files = [path for path, size, mtime in entries]
+    stamps = [(size, mtime) for path, size, mtime in entries]
+    index = settings.fileIndex()
+    old = [(index.path(i), index.stamp(i)) for i in range(len(index))]
+    key = obj.data.shape_keys
+    if key is None or len(old) == 0 or len(key.key_blocks) != len(old):
+        return None
+    if files[0] != old[0][0] or stamps[0] != old[0][1]:
+        #the base mesh changed
+        return None
+    oldIndex = {path: i for i, (path, stamp) in enumerate(old)}
+    fileSet = set(files)
+    kept = [path for path, stamp in old if path in fileSet]
+    if files[:len(kept)] != kept:
+        #new files in the middle of the sequence, the keys would have to be reordered
+        return None
+    removed = [path for path, stamp in old if path not in fileSet]
+    changed = [i for i in range(1, len(kept)) if stamps[i] != old[oldIndex[files[i]]][1]]
+    added = list(range(len(kept), len(files)))
+    
+    wm = bpy.context.window_manager
+    wm.progress_begin(0, len(changed)+len(added))
+    toRemove = [key.key_blocks[oldIndex[path]] for path in removed]
+    for sk in toRemove:
+        obj.shape_key_remove(sk)
+    #after removing, key i belongs to files[i]
+    numVerts = len(obj.data.vertices)
+    readMatrix = settings.getReadMatrix()
+    toRead = [files[i] for i in changed + added]
+    if readMatrix is not None:
+        signature = readerSignature(fileImporter, fileExt, readMatrix)
+        numWorkers, maxInFlight = readAheadLimits(numVerts, entries[0][1])
+        frames = pipeline.readFrames(fileExt, toRead, readMatrix, numWorkers, maxInFlight, getFrameCache(), signature)
+    else:
+        frames = ((f, None) for f in toRead)
+    for count, (i, (f, coords)) in enumerate(zip(changed + added, frames)):
+        if coords is None:
+            frameCoords = importFrameCoords(fileImporter, fileExt, f)
+            if len(frameCoords) != 1:
+                wm.progress_end()
+                return (-1, "Can't update sequence with multiple meshes at this time.")
+            coords = frameCoords[0][1]
+        if len(coords)//3 != numVerts:
+            wm.progress_end()
+            return (-2, "Imported object in %s has difference vertex number (%d) than base object (%d)" % (f, len(coords)//3, numVerts))
+        if i < len(key.key_blocks):
+            sk = key.key_blocks[i]
+        else:
+            sk = obj.shape_key_add(name='Frame '+str(i), from_mix=False)
+            sk.interpolation = 'KEY_LINEAR'
+        sk.data.foreach_set('co', coords)
+        wm.progress_update(count+1)
+    
+    if len(removed) > 0:
+        #frame numbers shifted, rename and rekey everything
+        if key.animation_data is not None and key.animation_data.action is not None:
+            key.animation_data.action.fcurves.clear()
+        for i, sk in enumerate(key.key_blocks):
+            if i > 0:
+                sk.name = 'Frame '+str(i)
+        keyframeShapeKeys(obj)
+    elif len(added) > 0:
+        #the previous last key also needs to be switched off again
+        keyframeShapeKeys(obj, first=len(kept)-1)
+    wm.progress_end()
+    obj.data.update()
+    settings.setFiles(entries)
+    settings.numMeshes = len(files)
+    return (len(files), len(changed)+len(added))
+
+
+def appendFrames(obj, frames, watcher):
+    """ Add a shape key for each (file, positions) after the current last frame and key them.
+        Files with a different vertex number may still be written, they go back to the watcher
+        with the ones after them
+    """
+    settings = obj.objsk_settings
+    key = obj.data.shape_keys
+    numVerts = len(obj.data.vertices)
+    lastKey = frameKey(settings.fileIndex().path(-1))
+    first = len(key.key_blocks)
+    waiting = False
+    for f, coords in frames:
+        if waiting:
+            #keep the frame order, the ones after a retried file are added after it
+            watcher.retry(f, changed=False)
+            continue
+        if len(coords)//3 != numVerts:
+            print('Waiting for %s, it has a different vertex number than the base object' % f)
+            watcher.retry(f)
+            waiting = True
+            continue
+        if frameKey(f) < lastKey:
+            print('Skipping %s, it sorts before the last frame of the sequence' % f)
+            continue
+        sk = obj.shape_key_add(name='Frame '+str(len(key.key_blocks)), from_mix=False)
+        sk.interpolation = 'KEY_LINEAR'
+        sk.data.foreach_set('co', coords)
+        settings.addFile(f)
+        lastKey = frameKey(f)
+    if len(key.key_blocks) > first:
+        keyframeShapeKeys(obj, first=first-1)
+        settings.numMeshes = len(key.key_blocks)
+        obj.data.update()
+
+#object name -> FolderWatcher for sequences with live update running
+sequenceWatchers = {}
+
+def watchSequences():
+    """ Timer callback: poll every watched folder and attach the frames parsed since the last tick
+    """
+    for name, watcher in list(sequenceWatchers.items()):
+        obj = bpy.data.objects.get(name)
+        if obj is None or not obj.objsk_settings.initialized or obj.data.shape_keys is None:
+            sequenceWatchers.pop(name).stop()
+            continue
+        watcher.poll()
+        frames = watcher.results()
+        if len(frames) > 0:
+            appendFrames(obj, frames, watcher)
+    if len(sequenceWatchers) == 0:
+        return None
+    return getPreferences().watchInterval
+
+#object name -> [store path, FrameStore or FrameWindow, base positions, last applied frame] for objects played back from a frame store
+openStores = {}
+
+def getFrameStore(obj):
+    settings = obj.objsk_settings
+    if settings.storageMode in ('LAZY', 'SWAP'):
+        path = (bpy.path.abspath(settings.dirPath), settings.fileToken)
+    else:
+        path = bpy.path.abspath(settings.storePath)
+    entry = openStores.get(obj.name)
+    if entry is None or entry[0] != path:
+        closeStore(obj.name)
+        if settings.storageMode == 'LAZY' and settings.fileExt in pointcache.FORMATS:
+            #the first frame of the cache is the base mesh
+            try:
+                store = pointcache.PointCache(settings.fileIndex().path(0), skip=1)
+            except (OSError, ValueError):
+                return None
+        elif settings.storageMode == 'LAZY':
+            readMatrix = settings.getReadMatrix()
+            if readMatrix is None:
+                return None
+            prefs = getPreferences()
+            signature = readerSignature(settings.importSettings, settings.fileExt, readMatrix)
+            files = settings.fileIndex().paths()[1:]
+            windowSize = prefs.windowSize
+            if prefs.memoryBudget > 0:
+                #the window holds parsed positions only
+                windowSize = max(1, min(windowSize, prefs.memoryBudget*1024*1024 // (12*len(obj.data.vertices))))
+            store = FrameWindow(files, settings.fileExt, readMatrix, getFrameCache(), signature, windowSize, prefs.readAhead)
+        elif settings.storageMode == 'SWAP':
+            readMatrix = settings.getReadMatrix()
+            if readMatrix is None:
+                return None
+            prefs = getPreferences()
+            windowSize = prefs.windowSize
+            if prefs.memoryBudget > 0:
+                #the window holds whole frames, sized like the current one
+                mesh = obj.data
+                frameBytes = 12*len(mesh.vertices) + 12*len(mesh.loops) + 8*len(mesh.polygons)
+                windowSize = max(1, min(windowSize, prefs.memoryBudget*1024*1024 // max(1, frameBytes)))
+            #every file is a frame, the mesh is rebuilt for the first one as well
+            store = FrameWindow(settings.fileIndex().paths(), settings.fileExt, readMatrix, None, '', windowSize, prefs.readAhead, meshes=True)
+        else:
+            try:
+                store = FrameStore(path)
+            except (OSError, ValueError):
+                return None
+        if settings.storageMode == 'SWAP':
+            entry = [path, store, None, None]
+            openStores[obj.name] = entry
+            return entry
+        base = np.empty(3*len(obj.data.vertices), dtype=np.float32)
+        obj.data.shape_keys.reference_key.data.foreach_get('co', base)
+        entry = [path, store, base.reshape(-1, 3), None]
+        openStores[obj.name] = entry
+    return entry
+
+def closeStore(name):
+    entry = openStores.pop(name, None)
+    if entry is not None:
+        entry[1].close()
+
+def fillMesh(mesh, frameMesh):
+    """ Replace the geometry of a mesh with a meshio.MeshData. The materials stay, faces get the slot of the
+        material with their usemtl name
+    """
+    slots = {}
+    for i, mat in enumerate(mesh.materials):
+        if mat is not None:
+            slots.setdefault(re.sub(r'\.[0-9]{3}$', '', mat.name), i)
+    smooth = len(mesh.polygons) > 0 and mesh.polygons[0].use_smooth
+    uvName = mesh.uv_layers.active.name if mesh.uv_layers.active is not None else 'UVMap'
+    mesh.clear_geometry()
+    sizes = np.frombuffer(frameMesh.faceSizes, dtype=np.int32)
+    mesh.vertices.add(len(frameMesh.coords)//3)
+    mesh.vertices.foreach_set('co', frameMesh.coords)
+    mesh.loops.add(len(frameMesh.faceIndices))
+    mesh.loops.foreach_set('vertex_index', frameMesh.faceIndices)
+    mesh.polygons.add(len(sizes))
+    mesh.polygons.foreach_set('loop_start', (np.cumsum(sizes) - sizes).astype(np.int32))
+    mesh.polygons.foreach_set('loop_total', sizes)
+    if len(frameMesh.faceMaterials) == len(sizes) and len(slots) > 0:
+        #faces before the first usemtl and unknown materials get the first slot
+        lookup = np.array([slots.get(name, 0) for name in frameMesh.materialNames], dtype=np.int32)
+        mesh.polygons.foreach_set('material_index', lookup[np.frombuffer(frameMesh.faceMaterials, dtype=np.int32)])
+    if smooth:
+        mesh.polygons.foreach_set('use_smooth', np.ones(len(sizes), dtype=bool))
+    if frameMesh.uvs is not None:
+        layer = mesh.uv_layers.get(uvName) or mesh.uv_layers.new(name=uvName)
+        layer.data.foreach_set('uv', frameMesh.uvs)
+    mesh.update(calc_edges=True)
+
+def swapMesh(obj, frame):
+    """ Rebuild the mesh of a SWAP sequence object from the frame shown, read through its window
+    """
+    entry = getFrameStore(obj)
+    if entry is None:
+        return
+    path, store, base, lastIndex = entry
+    index = max(0, min(frame-1-obj.objsk_settings.frameOffset, store.numFrames-1))
+    if index == lastIndex:
+        return
+    entry[3] = index
+    frameMesh = store.positions(index)
+    if frameMesh is None:
+        print('Skipping frame %d of %s, its file could not be read' % (index+1, obj.name))
+        return
+    fillMesh(obj.data, frameMesh)
+
+@persistent
+def applyStoredFrames(scene, *args):
+    """ frame_change_pre handler: write the current frame of every frame store sequence into its shape key
+    """
+    for obj in scene.objects:
+        settings = obj.objsk_settings
+        if not settings.initialized or settings.storageMode == 'KEYS':
+            continue
+        if settings.storageMode == 'SWAP':
+            swapMesh(obj, scene.frame_current)
+            continue
+        if obj.data.shape_keys is None:
+            continue
+        sk = obj.data.shape_keys.key_blocks.get('Sequence')
+        entry = getFrameStore(obj)
+        if sk is None or entry is None:
+            continue
+        path, store, base, lastIndex = entry
+        #frame 1 is the base mesh, the last frame stays after the end like with shape keys
+        index = min(scene.frame_current-2-settings.frameOffset, store.numFrames-1)
+        if index == lastIndex:
+            continue
+        entry[3] = index
+        if index < 0:
+            sk.data.foreach_set('co', base.ravel())
+        else:
+            coords = store.positions(index, base)
+            if coords is None or len(coords) != base.size:
+                #only possible for files read on demand
+                print('Skipping frame %d of %s, its file could not be read or has a different vertex number than the base object' % (index+2, obj.name))
+                continue
+            sk.data.foreach_set('co', coords)
+        obj.data.update()
+
+@persistent
+def closeSequences(dummy):
+    """ Stop live updates and close frame stores, before another file is loaded
+    """
+    for watcher in sequenceWatchers.values():
+        watcher.stop()
+    sequenceWatchers.clear()
+    for name in list(openStores):
+        closeStore(name)
+    fileIndexes.clear()
+
+
+@orientation_helper(axis_forward='-Z', axis_up='Y')
+class ImportObjShapeKeys(bpy.types.Operator, ImportHelper):
+    """Load a mesh sequence as shape keys"""
+    bl_idname = "objsk.import_sequence"
+    bl_label = "Select Folder"
+    bl_options = {'UNDO'}
+    
+    importSettings: bpy.props.PointerProperty(type=MeshImporter)
+    sequenceSettings: bpy.props.PointerProperty(type=SequenceImportSettings)
+    
+    filter_glob: bpy.props.StringProperty(default="*.obj;*.mtl;*.stl;*.ply")
+    directory: bpy.props.StringProperty(subtype='DIR_PATH')
+    
+    axis_forward: bpy.props.StringProperty(default='-Z')
+    axis_up: bpy.props.StringProperty(default='Y')
+    
+    def resetToDefault(self):
+        self.sequenceSettings.fileNamePrefix = ""
+        self.filepath = ""
+        self.axis_forward = "-Z"
+        self.axis_up = "Y"
+    
+    def execute(self, context):
+        #import first file as base
+        if context.mode != 'OBJECT':
+            self.report({'ERROR'}, "You may import only while in Object mode")
+            return {'CANCELLED'}
+        self.importSettings.axis_forward = self.axis_forward
+        self.importSettings.axis_up = self.axis_up
+        
+        global_matrix = axis_conversion(from_forward=self.axis_forward, from_up=self.axis_up).to_4x4()
+        
+        #load sequence
+        meshCount, seqObjs = loadSequence(self.directory, self.sequenceSettings.fileNamePrefix, self.sequenceSettings.fileFormat, self.importSettings,
+                                          storageMode=self.sequenceSettings.storageMode, staticThreshold=self.sequenceSettings.staticThreshold,
+                                          reduceTolerance=self.sequenceSettings.reduceTolerance, reduceMode=self.sequenceSettings.reduceMode,
+                                          topologyMode=self.sequenceSettings.topologyMode)
+        self.resetToDefault()
+        if meshCount == 0:
+            self.report({'ERROR'}, "No matching files found. Make sure the Root Folder, File Name, and File Format are correct.")
+            return {'CANCELLED'}
+        if meshCount < 0:
+            #use the other return as the string, bit of a hack
+            self.report({'ERROR'}, seqObjs)
+            return {'CANCELLED'}
+        
+        for seqObj in seqObjs:
+            seqObj.matrix_world = global_matrix
+            #update name
+            meshName = os.path.splitext(seqObj.name)[0].rstrip('._0123456789')
+            seqObj.name = meshName + '_shapekeys'
+        #set the frame to the start
+        context.scene.frame_set(1)
+        
+        return {'FINISHED'}
+    
+    def draw(self, context):
+        pass
+        
+
+class SKO_PT_FileImportSettingsPanel(bpy.types.Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = 'File Settings'
+    bl_parent_id = 'FILE_PT_operator'
+    
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.active_operator.bl_idname == "OBJSK_OT_import_sequence"
+    
+    def draw(self, context):
+        op  = context.space_data.active_operator
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        layout.row().prop(op.sequenceSettings, "fileFormat")
+        
+        if op.sequenceSettings.fileFormat == 'obj':
+            layout.prop(op.importSettings, 'obj_global_scale')
+            layout.prop(op.importSettings, 'obj_global_clamp_size')
+            col = layout.column()
+            col.prop(op.importSettings, 'obj_use_groups_as_vgroups')
+            col.prop(op.importSettings, 'obj_use_split_objects')
+            col.prop(op.importSettings, 'obj_use_split_groups')
+        elif op.sequenceSettings.fileFormat == 'stl':
+            layout.row().prop(op.importSettings, 'stl_global_scale')
+            layout.row().prop(op.importSettings, 'stl_use_scene_unit')
+            layout.row().prop(op.importSettings, 'stl_use_facet_normal')
+        elif op.sequenceSettings.fileFormat == 'ply':
+            layout.row().prop(op.importSettings, 'ply_global_scale')
+            layout.row().prop(op.importSettings, 'ply_use_scene_unit')
+    
+    
+class SKO_PT_TransformSettingsPanel(bpy.types.Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = 'Transform'
+    bl_parent_id = 'FILE_PT_operator'
+    
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.active_operator.bl_idname == "OBJSK_OT_import_sequence"
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        
+        op = context.space_data.active_operator
+        layout.prop(op, 'axis_forward')
+        layout.prop(op, 'axis_up')
+    
+
+class SKO_PT_SequenceImportSettingsPanel(bpy.types.Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = 'Sequence Settings'
+    bl_parent_id = 'FILE_PT_operator'
+    
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.active_operator.bl_idname == "OBJSK_OT_import_sequence"
+    
+    def draw(self, context):
+        op = context.space_data.active_operator
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        col = layout.column(align=False)
+        
+        row = col.row()
+        if op.sequenceSettings.fileNamePrefix == "":
+            row.alert = True
+        row.prop(op.sequenceSettings, 'fileNamePrefix')
+        col.prop(op.sequenceSettings, 'storageMode')
+        col.prop(op.sequenceSettings, 'topologyMode')
+        if op.sequenceSettings.storageMode == 'DELTA':
+            col.prop(op.sequenceSettings, 'staticThreshold')
+        elif op.sequenceSettings.storageMode == 'KEYS':
+            col.prop(op.sequenceSettings, 'reduceTolerance')
+            if op.sequenceSettings.reduceTolerance > 0.0:
+                col.prop(op.sequenceSettings, 'reduceMode')
+
+
+def menu_func_import_sequence(self, context):
+    self.layout.operator(ImportObjShapeKeys.bl_idname, text="Obj Shape Keys")
+    self.layout.operator(ImportPointCache.bl_idname, text="Point Cache as Shape Keys (.pc2/.mdd)")
+
+def menu_func_export_point_cache(self, context):
+    self.layout.operator(ExportPointCache.bl_idname, text="Shape Keys as Point Cache (.pc2/.mdd)")
+
+
+def register():
+    bpy.utils.register_class(OBJShapeKeysPreferences)
+    bpy.utils.register_class(MeshImporter)
+    bpy.utils.register_class(MeshSequenceSettings)
+    bpy.utils.register_class(ReloadMeshSequence)
+    bpy.utils.register_class(ClearFrameCache)
+    bpy.utils.register_class(WatchMeshSequence)
+    bpy.utils.register_class(ExportPointCache)
+    bpy.utils.register_class(ImportPointCache)
+    bpy.app.handlers.load_pre.append(closeSequences)
+    bpy.app.handlers.frame_change_pre.append(applyStoredFrames)
+    bpy.types.Object.objsk_settings = bpy.props.PointerProperty(type=MeshSequenceSettings)
+    #importer settings for scripted imports (batch.py) that don't go through the import operator
+    bpy.types.WindowManager.objsk_import_settings = bpy.props.PointerProperty(type=MeshImporter)
+    #add option to import menu
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import_sequence)
+    bpy.types.TOPBAR_MT_file_export.append(menu_func_export_point_cache)
+    #add in order to be drawn
+    bpy.utils.register_class(SKO_PT_FileImportSettingsPanel)
+    bpy.utils.register_class(SKO_PT_TransformSettingsPanel)
+    bpy.utils.register_class(SKO_PT_SequenceImportSettingsPanel)
+    bpy.utils.register_class(OBJShapeKeysPanel)
+    bpy.utils.register_class(SequenceImportSettings)
+    bpy.utils.register_class(ImportObjShapeKeys)
+
+    
+def unregister():
+    del bpy.types.WindowManager.objsk_import_settings
+    bpy.utils.unregister_class(OBJShapeKeysPreferences)
+    bpy.utils.unregister_class(MeshImporter)
+    bpy.utils.unregister_class(MeshSequenceSettings)
+    bpy.utils.unregister_class(ReloadMeshSequence)
+    bpy.utils.unregister_class(ClearFrameCache)
+    bpy.utils.unregister_class(WatchMeshSequence)
+    bpy.utils.unregister_class(ExportPointCache)
+    bpy.utils.unregister_class(ImportPointCache)
+    bpy.app.handlers.load_pre.remove(closeSequences)
+    bpy.app.handlers.frame_change_pre.remove(applyStoredFrames)
+    closeSequences(None)
+    if bpy.app.timers.is_registered(watchSequences):
+        bpy.app.timers.unregister(watchSequences)
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import_sequence)
+    bpy.types.TOPBAR_MT_file_export.remove(menu_func_export_point_cache)
+    bpy.utils.unregister_class(SKO_PT_FileImportSettingsPanel)
+    bpy.utils.unregister_class(SKO_PT_TransformSettingsPanel)
+    bpy.utils.unregister_class(SKO_PT_SequenceImportSettingsPanel)
+    bpy.utils.unregister_class(OBJShapeKeysPanel)
+    bpy.utils.unregister_class(SequenceImportSettings)
+    bpy.utils.unregister_class(ImportObjShapeKeys)
+
@@ -0,0 +1,119 @@
+import os
+import sys
+import json
+import time
+import logging
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    #windows
+    resource = None
+
+#Instrumentation for sequence imports: time per phase and per frame, bytes read, vertices transferred
+#and memory use. Doesn't depend on bpy. Anything interested in the numbers while an import runs can pass
+#a callback, which gets called as callback(kind, name, value) with kind 'phase' (name, seconds),
+#'frame' (file, seconds) or 'done' (None, summary dict). Per frame timings are also logged at debug level
+#and the summary at info level on the 'import_obj_shapekey' logger.
+
+logger = logging.getLogger(__package__ or 'import_obj_shapekey')
+
+
+def currentMemory():
+    """ Resident memory of this process in bytes, or its peak where the current value isn't available
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        #kilobytes on linux, bytes on macOS
+        return peak if sys.platform == 'darwin' else peak*1024
+    return 0
+
+
+class ImportStats:
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.phases = {}
+        self.frames = []
+        self.bytesRead = 0
+        self.verticesTransferred = 0
+        self.peakMemory = currentMemory()
+        self.start = time.perf_counter()
+        self.totalTime = 0.0
+
+    def addPhase(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if self.callback is not None:
+            self.callback('phase', name, seconds)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addPhase(name, time.perf_counter() - start)
+
+    def timed(self, iterable, name):
+        """ Iterate, counting the time spent waiting for each item towards a phase
+        """
+        it = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.addPhase(name, time.perf_counter() - start)
+                return
+            self.addPhase(name, time.perf_counter() - start)
+            yield item
+
+    def addFrame(self, filePath, seconds, numVerts):
+        self.frames.append((filePath, seconds))
+        self.verticesTransferred += numVerts
+        try:
+            self.bytesRead += os.path.getsize(filePath)
+        except OSError:
+            pass
+        self.peakMemory = max(self.peakMemory, currentMemory())
+        logger.debug("%s: %.4fs, %d vertices", filePath, seconds, numVerts)
+        if self.callback is not None:
+            self.callback('frame', filePath, seconds)
+
+    def finish(self):
+        self.totalTime = time.perf_counter() - self.start
+        self.peakMemory = max(self.peakMemory, currentMemory())
+        summary = self.summary()
+        logger.info("Imported %d frames in %.2fs (%.1f frames/s, %.1f MB read, peak memory %.1f MB)",
+                    summary['frames'], self.totalTime, summary['framesPerSecond'], self.bytesRead/(1024*1024), self.peakMemory/(1024*1024))
+        if self.callback is not None:
+            self.callback('done', None, summary)
+        return summary
+
+    def summary(self):
+        slowest = sorted(self.frames, key=lambda f: f[1], reverse=True)[:5]
+        return {
+            'frames': len(self.frames),
+            'seconds': self.totalTime,
+            'framesPerSecond': len(self.frames)/self.totalTime if self.totalTime > 0.0 else 0.0,
+            'bytesRead': self.bytesRead,
+            'verticesTransferred': self.verticesTransferred,
+            'peakMemory': self.peakMemory,
+            'phases': self.phases,
+            'slowestFrames': slowest,
+        }
+
+    def writeLog(self, path, **info):
+        """ Append the summary and any extra info (e.g. which sequence it was) as one JSON line
+        """
+        entry = dict(info)
+        entry['time'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        entry.update(self.summary())
+        with open(path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
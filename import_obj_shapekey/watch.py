@@ -0,0 +1,112 @@
+import os
+import queue
+import threading
+from . import pipeline
+
+#Watches a sequence folder for new frames while a simulation is still writing them.
+#poll() is cheap enough to run from a timer on Blender's main thread (one os.scandir, no glob or sort of
+#the whole folder). Files are only parsed once their size stayed the same for a whole tick, the parsing
+#happens on a background thread and finished frames are picked up with results(). Files that can't be
+#read yet (e.g. a writer that paused mid file) go back to the size tracking and are tried again once
+#their size changes.
+
+
+class FolderWatcher:
+    def __init__(self, directory, prefix, fileExt, known, sortKey, matrix=None, cache=None, signature=''):
+        self.directory = directory
+        self.prefix = prefix
+        self.suffix = '.' + fileExt
+        self.fileExt = fileExt
+        self.sortKey = sortKey
+        self.matrix = matrix
+        self.cache = cache
+        self.signature = signature
+        #files already in the sequence or queued for parsing
+        self.known = set(known)
+        #file -> size seen on the previous tick
+        self.sizes = {}
+        #file -> size it had when it failed, not tried again until that changes
+        self.failed = {}
+        #file -> size it was parsed at, for the frames of the last results() call
+        self.parsed = {}
+        self.todo = queue.Queue()
+        self.done = queue.Queue()
+        self.thread = threading.Thread(target=self.parseLoop, daemon=True)
+        self.thread.start()
+
+    def poll(self):
+        """ Scan the folder once and queue every new file whose size didn't change since the last poll
+        """
+        sizes = {}
+        stable = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.startswith(self.prefix) or not name.endswith(self.suffix):
+                        continue
+                    path = os.path.join(self.directory, name)
+                    if path in self.known:
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if self.failed.get(path) == size:
+                        continue
+                    if size > 0 and self.sizes.get(path) == size:
+                        stable.append((path, size))
+                    else:
+                        sizes[path] = size
+        except OSError:
+            return
+        self.sizes = sizes
+        for path, size in sorted(stable, key=lambda s: self.sortKey(s[0])):
+            self.failed.pop(path, None)
+            self.known.add(path)
+            self.todo.put((path, size))
+
+    def parseLoop(self):
+        while True:
+            item = self.todo.get()
+            if item is None:
+                return
+            path, size = item
+            coords = self.cache.get(path, self.signature) if self.cache is not None else None
+            if coords is None:
+                coords = pipeline.readPositions(self.fileExt, path, self.matrix, None)
+                if coords is not None and self.cache is not None:
+                    self.cache.put(path, self.signature, coords)
+            self.done.put((path, size, coords))
+
+    def results(self):
+        """ (path, positions) of every frame parsed since the last call, in the order they were queued.
+            A file that couldn't be read is retried, along with the ones after it so the order is kept
+        """
+        ready = []
+        self.parsed = {}
+        failed = False
+        while True:
+            try:
+                path, size, coords = self.done.get_nowait()
+            except queue.Empty:
+                return ready
+            self.parsed[path] = size
+            if coords is None:
+                self.retry(path)
+                failed = True
+            elif failed:
+                self.retry(path, changed=False)
+            else:
+                ready.append((path, coords))
+
+    def retry(self, path, changed=True):
+        """ Track a file from the last results() again, e.g. because it was only partly written.
+            With changed it's only read again once its size differs from the one it was parsed at
+        """
+        self.known.discard(path)
+        if changed:
+            self.failed[path] = self.parsed.get(path)
+
+    def stop(self):
+        self.todo.put(None)
@@ -0,0 +1,109 @@
+import queue
+import threading
+from collections import OrderedDict
+from . import pipeline
+
+#Frames of very long sequences, read on demand instead of all at import.
+#Only a window of parsed frames around the current one is kept in memory. Requests come from Blender's
+#main thread, the frames after the current one (in the direction playback is going) are read ahead on a
+#background thread and the least recently used frames are dropped once the window is full, so memory use
+#depends on the window size and not on the length of the sequence.
+#With meshes the window holds whole frames (meshio.MeshData) instead of positions, for SWAP sequences.
+
+
+class FrameWindow:
+    """ Same interface as framestore.FrameStore (numFrames, positions(), close()), but reading the
+        sequence files themselves. files are the frames after the base, in order
+    """
+    def __init__(self, files, fileExt, matrix=None, cache=None, signature='', size=32, readAhead=8, meshes=False):
+        self.files = list(files)
+        self.numFrames = len(self.files)
+        self.fileExt = fileExt
+        self.matrix = matrix
+        self.cache = cache
+        self.signature = signature
+        self.meshes = meshes
+        self.size = max(1, size)
+        #never read further ahead than what fits into the window
+        self.readAhead = max(0, min(readAhead, self.size-1))
+        #index -> positions, oldest use first. Only touched on the main thread
+        self.frames = OrderedDict()
+        self.pending = set()
+        self.lastIndex = None
+        self.direction = 1
+        #indices the read ahead thread should still bother with
+        self.wanted = (0, -1)
+        self.todo = queue.Queue()
+        self.done = queue.Queue()
+        self.thread = threading.Thread(target=self.readLoop, daemon=True)
+        self.thread.start()
+
+    def read(self, index):
+        path = self.files[index]
+        if self.meshes:
+            return pipeline.readMesh(self.fileExt, path, self.matrix)
+        coords = self.cache.get(path, self.signature) if self.cache is not None else None
+        if coords is None:
+            coords = pipeline.readPositions(self.fileExt, path, self.matrix, None)
+            if coords is not None and self.cache is not None:
+                self.cache.put(path, self.signature, coords)
+        return coords
+
+    def readLoop(self):
+        while True:
+            index = self.todo.get()
+            if index is None:
+                return
+            lo, hi = self.wanted
+            if index < lo or index > hi:
+                #playback jumped somewhere else since this was queued
+                self.done.put((index, None, False))
+                continue
+            self.done.put((index, self.read(index), True))
+
+    def collect(self):
+        while True:
+            try:
+                index, coords, read = self.done.get_nowait()
+            except queue.Empty:
+                return
+            self.pending.discard(index)
+            if read:
+                self.store(index, coords)
+
+    def store(self, index, coords):
+        self.frames[index] = coords
+        self.frames.move_to_end(index)
+        while len(self.frames) > self.size:
+            self.frames.popitem(last=False)
+
+    def positions(self, index, base=None):
+        """ Positions (or mesh) of frame index, read right away if it isn't in the window yet. None if the file
+            can't be read. Queues the read ahead for the frames after it
+        """
+        self.collect()
+        if self.lastIndex is not None and index != self.lastIndex:
+            self.direction = 1 if index > self.lastIndex else -1
+        self.lastIndex = index
+        if index in self.frames:
+            self.frames.move_to_end(index)
+            coords = self.frames[index]
+        else:
+            coords = self.read(index)
+            self.store(index, coords)
+        ahead = [index + self.direction*i for i in range(1, self.readAhead+1)]
+        ahead = [i for i in ahead if 0 <= i < self.numFrames]
+        self.wanted = (min(ahead), max(ahead)) if len(ahead) > 0 else (0, -1)
+        for i in ahead:
+            if i in self.frames:
+                #keep frames that are about to be used from being evicted first
+                self.frames.move_to_end(i)
+                self.frames.move_to_end(index)
+            elif i not in self.pending:
+                self.pending.add(i)
+                self.todo.put(i)
+        return coords
+
+    def close(self):
+        self.todo.put(None)
+        self.frames.clear()
@@ -0,0 +1,61 @@
+import os
+import numpy as np
+import pytest
+from import_obj_shapekey import batch
+from import_obj_shapekey.pointcache import PointCache
+
+
+def writeFrames(directory, numFrames, header=''):
+    for i in range(numFrames):
+        with open(os.path.join(directory, 'frame_%03d.obj' % (i+1)), 'w') as f:
+            f.write(header)
+            f.write('v %d 1 2\nv 0 0 0\nf 1 2 2\n' % i)
+
+def job(directory, output, **settings):
+    return {'directory': directory, 'prefix': 'frame_', 'format': 'obj', 'output': output, 'settings': settings}
+
+def test_point_cache_settings(tmp_path):
+    directory = str(tmp_path)
+    writeFrames(directory, 3)
+    output = str(tmp_path / 'out.pc2')
+    report = batch.runJob(job(directory, output, obj_global_scale=2.0), 1, 0)
+    assert report['error'] is None
+    assert (report['files'], report['vertices'], report['frames']) == (3, 2, 3)
+    cache = PointCache(output)
+    try:
+        #the default -Z forward, Y up: x stays, y = -z, z = y
+        assert np.allclose(cache.positions(2)[:3], [4.0, -4.0, 2.0])
+    finally:
+        cache.close()
+    #in the files' own coordinates
+    report = batch.runJob(job(directory, output, axis_forward='Y', axis_up='Z'), 1, 0)
+    assert report['error'] is None
+    cache = PointCache(output)
+    try:
+        assert np.allclose(cache.positions(2)[:3], [2.0, 1.0, 2.0])
+    finally:
+        cache.close()
+
+@pytest.mark.parametrize('settings', [{'obj_global_clamp_size': 1.0}, {'ply_use_scene_unit': True}, {'use_smooth': True},
+                                      {'axis_forward': 'Y', 'axis_up': 'Y'}])
+def test_point_cache_rejects_settings(tmp_path, settings):
+    directory = str(tmp_path)
+    writeFrames(directory, 2)
+    report = batch.runJob(job(directory, str(tmp_path / 'out.pc2'), **settings), 1, 0)
+    assert report['error'] is not None
+
+def test_point_cache_several_objects(tmp_path):
+    directory = str(tmp_path)
+    writeFrames(directory, 2, header='o A\nv 0 0 1\no B\n')
+    report = batch.runJob(job(directory, str(tmp_path / 'out.pc2')), 1, 0)
+    assert 'several objects' in report['error']
+    #imported as a single object without splitting
+    report = batch.runJob(job(directory, str(tmp_path / 'out.pc2'), obj_use_split_objects=False), 1, 0)
+    assert report['error'] is None
+    assert report['vertices'] == 3
+
+def test_unknown_output(tmp_path):
+    directory = str(tmp_path)
+    writeFrames(directory, 2)
+    report = batch.runJob(job(directory, str(tmp_path / 'out.objsk')), 1, 0)
+    assert report['error'] == "Output has to be a .blend, .pc2 or .mdd file"
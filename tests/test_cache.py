@@ -0,0 +1,56 @@
+import os
+import time
+from array import array
+from import_obj_shapekey.cache import FrameCache, LOW_WATER
+
+
+def sourceFiles(directory, count):
+    files = []
+    for i in range(count):
+        path = os.path.join(directory, 'frame_%d.obj' % i)
+        with open(path, 'w') as f:
+            f.write('v %d 0 0\n' % i)
+        files.append(path)
+    return files
+
+def test_put_get(tmp_path):
+    f, = sourceFiles(str(tmp_path), 1)
+    cache = FrameCache(str(tmp_path / 'cache'), 1 << 20)
+    assert cache.get(f, 'sig') is None
+    cache.put(f, 'sig', array('f', [1.0, 2.0, 3.0]))
+    assert list(cache.get(f, 'sig')) == [1.0, 2.0, 3.0]
+    #a changed file never hits the old entry
+    with open(f, 'a') as out:
+        out.write('v 1 1 1\n')
+    assert cache.get(f, 'sig') is None
+
+def test_evicts_least_recently_used_to_low_water(tmp_path):
+    files = sourceFiles(str(tmp_path), 10)
+    entryBytes = 4*250
+    cache = FrameCache(str(tmp_path / 'cache'), 5*entryBytes)
+    for i, f in enumerate(files):
+        cache.put(f, 'sig', array('f', [float(i)])*250)
+        #least recently used is told by the mtime, make sure every entry gets a different one
+        past = time.time() - 100 + i
+        os.utime(cache.entryPath(f, 'sig'), (past, past))
+    assert cache.size <= 5*entryBytes
+    assert cache.get(files[-1], 'sig') is not None
+    assert cache.get(files[0], 'sig') is None
+
+def test_low_water(tmp_path):
+    files = sourceFiles(str(tmp_path), 6)
+    entryBytes = 4*100
+    cache = FrameCache(str(tmp_path / 'cache'), 5*entryBytes)
+    for f in files:
+        cache.put(f, 'sig', array('f', [0.0])*100)
+    #going over the limit evicts down to the low water mark, not just below the limit
+    assert cache.size <= LOW_WATER*5*entryBytes
+
+def test_unwritable_folder(tmp_path):
+    f, = sourceFiles(str(tmp_path), 1)
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    cache = FrameCache(str(blocker / 'cache'), 1 << 20)
+    assert cache.write(f, 'sig', array('f', [1.0])) is None
+    cache.put(f, 'sig', array('f', [1.0]))
+    assert cache.get(f, 'sig') is None
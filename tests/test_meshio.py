@@ -0,0 +1,163 @@
+import struct
+import numpy as np
+import pytest
+from import_obj_shapekey import meshio
+
+COORDS = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.5), (-2.5, 3.25, 1.0)]
+TRIS = [(0, 1, 2), (0, 2, 3)]
+
+
+def flat(coords):
+    return [c for v in coords for c in v]
+
+def writeOBJ(path, coords, tris, header=''):
+    with open(path, 'w') as f:
+        f.write(header)
+        for v in coords:
+            f.write('v %f %f %f\n' % v)
+        for t in tris:
+            f.write('f %d %d %d\n' % tuple(i+1 for i in t))
+
+def writePLY(path, fmt, coords, tris):
+    header = ("ply\nformat %s 1.0\ncomment made by hand\nelement vertex %d\nproperty float x\nproperty float y\nproperty float z\n"
+              "element face %d\nproperty list uchar int vertex_indices\nend_header\n" % (fmt, len(coords), len(tris)))
+    with open(path, 'wb') as f:
+        f.write(header.encode('ascii'))
+        if fmt == 'ascii':
+            for v in coords:
+                f.write(('%f %f %f\n' % v).encode('ascii'))
+            for t in tris:
+                f.write(('3 %d %d %d\n' % t).encode('ascii'))
+            return
+        order = '<' if fmt == 'binary_little_endian' else '>'
+        for v in coords:
+            f.write(struct.pack(order+'3f', *v))
+        for t in tris:
+            f.write(struct.pack(order+'B3i', 3, *t))
+
+def writeSTL(path, coords, tris):
+    with open(path, 'wb') as f:
+        f.write(b'\0'*80)
+        f.write(struct.pack('<I', len(tris)))
+        for t in tris:
+            f.write(struct.pack('<12fH', 0.0, 0.0, 0.0, *flat(coords[i] for i in t), 0))
+
+
+def test_obj_positions(tmp_path):
+    path = str(tmp_path / 'frame_0001.obj')
+    writeOBJ(path, COORDS, TRIS, header='# comment\nmtllib frame.mtl\no Mesh\nvn 0 0 1\nvt 0 0\n')
+    assert list(meshio.readPositions('obj', path)) == flat(COORDS)
+
+def test_obj_objects(tmp_path):
+    path = str(tmp_path / 'frame_0001.obj')
+    with open(path, 'w') as f:
+        f.write('o B\nv 1 1 1\no A\nv 2 2 2\nv 3 3 3\n')
+    assert list(meshio.readPositions('obj', path, objects=(['A', 'B'], False))) == [2, 2, 2, 3, 3, 3, 1, 1, 1]
+    assert meshio.readPositions('obj', path, objects=(['A', 'C'], False)) is None
+
+@pytest.mark.parametrize('fmt', ['ascii', 'binary_little_endian', 'binary_big_endian'])
+def test_ply_positions(tmp_path, fmt):
+    path = str(tmp_path / 'frame_0001.ply')
+    writePLY(path, fmt, COORDS, TRIS)
+    assert list(meshio.readPositions('ply', path)) == flat(COORDS)
+
+def test_stl_positions(tmp_path):
+    path = str(tmp_path / 'frame_0001.stl')
+    writeSTL(path, COORDS, TRIS)
+    #vertices are merged in the order triangles first use them
+    assert list(meshio.readPositions('stl', path)) == flat(COORDS[i] for i in (0, 1, 2, 3))
+
+def test_ascii_stl_unsupported(tmp_path):
+    path = str(tmp_path / 'frame_0001.stl')
+    with open(path, 'w') as f:
+        f.write('solid x\nendsolid x\n')
+    assert meshio.readPositions('stl', path) is None
+
+def test_matrix(tmp_path):
+    path = str(tmp_path / 'frame_0001.obj')
+    writeOBJ(path, COORDS, TRIS)
+    matrix = meshio.axisConversion('-Z', 'Y', 2.0)
+    coords = np.array(meshio.readPositions('obj', path, matrix)).reshape(-1, 3)
+    #-Z forward, Y up: x stays, y = -z, z = y
+    expected = 2.0*np.array(COORDS)[:, [0, 2, 1]]*[1.0, -1.0, 1.0]
+    assert np.allclose(coords, expected)
+
+def test_strip_obj_materials(tmp_path):
+    src = str(tmp_path / 'a.obj')
+    dst = str(tmp_path / 'b.obj')
+    with open(src, 'w') as f:
+        f.write('mtllib a.mtl\no A\nv 1 2 3\nusemtl red\nf 1 1 1\n')
+    meshio.stripOBJMaterials(src, dst)
+    assert open(dst).read() == 'o A\nv 1 2 3\nf 1 1 1\n'
+
+
+@pytest.mark.parametrize('fmt', ['obj', 'ply', 'stl'])
+def test_vertex_count(tmp_path, fmt):
+    path = str(tmp_path / ('frame_0001.' + fmt))
+    if fmt == 'obj':
+        writeOBJ(path, COORDS, TRIS)
+        expected = len(COORDS)
+    elif fmt == 'ply':
+        writePLY(path, 'binary_little_endian', COORDS, TRIS)
+        expected = len(COORDS)
+    else:
+        writeSTL(path, COORDS, TRIS)
+        #the triangle count for STL
+        expected = len(TRIS)
+    assert meshio.readVertexCount(fmt, path) == expected
+
+@pytest.mark.parametrize('split', [0, 1, 2])
+def test_obj_vertex_count_chunk_boundary(tmp_path, split):
+    """ A 'v' line starting right at, one or two bytes into the second 16 MB chunk
+    """
+    chunk = 1 << 24
+    path = str(tmp_path / 'big.obj')
+    with open(path, 'wb') as f:
+        f.write(b'v 0 0 0\n')
+        padding = chunk - 8 - split
+        f.write(b'#' + b'x'*(padding-2) + b'\n')
+        f.write(b'v 1 1 1\nv 2 2 2\n')
+    assert meshio.readVertexCount('obj', path) == 3
+
+@pytest.mark.parametrize('fmt', ['obj', 'ply_ascii', 'ply_binary_big_endian', 'stl'])
+def test_mesh(tmp_path, fmt):
+    path = str(tmp_path / ('frame_0001.' + fmt[:3]))
+    if fmt == 'obj':
+        writeOBJ(path, COORDS, TRIS)
+    elif fmt == 'stl':
+        writeSTL(path, COORDS, TRIS)
+    else:
+        writePLY(path, fmt[4:], COORDS, TRIS)
+    mesh = meshio.readMesh(fmt[:3], path)
+    assert list(mesh.coords) == flat(COORDS)
+    assert list(mesh.faceSizes) == [3, 3]
+    assert list(mesh.faceIndices) == flat(TRIS)
+    assert mesh.uvs is None
+
+def test_obj_mesh_materials_and_uvs(tmp_path):
+    path = str(tmp_path / 'frame_0001.obj')
+    with open(path, 'w') as f:
+        f.write('v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nvt 0 0\nvt 1 0\nvt 1 1\nvt 0 1\n')
+        f.write('f 1/1 2/2 3/3\nusemtl red\nf 1/1 3/3 4/4\nusemtl blue\nf -4/-4 -3/-3 -2/-2 -1/-1\nusemtl red\nf 2/2 3/3 4/4\nl 1 2\n')
+    mesh = meshio.readMesh('obj', path, meshio.axisConversion('Y', 'Z', 2.0))
+    assert list(mesh.coords) == [0, 0, 0, 2, 0, 0, 2, 2, 0, 0, 2, 0]
+    assert list(mesh.faceSizes) == [3, 3, 4, 3]
+    assert list(mesh.faceIndices) == [0, 1, 2, 0, 2, 3, 0, 1, 2, 3, 1, 2, 3]
+    assert mesh.materialNames == [None, 'red', 'blue']
+    assert list(mesh.faceMaterials) == [0, 1, 2, 1]
+    assert list(mesh.uvs[:6]) == [0, 0, 1, 0, 1, 1]
+
+def test_ply_mesh_uvs(tmp_path):
+    path = str(tmp_path / 'frame_0001.ply')
+    with open(path, 'w') as f:
+        f.write('ply\nformat ascii 1.0\nelement vertex 3\nproperty float x\nproperty float y\nproperty float z\n'
+                'property float s\nproperty float t\nelement face 1\nproperty list uchar int vertex_indices\n'
+                'end_header\n0 0 0 0 0\n1 0 0 1 0\n1 1 0 1 1\n3 2 1 0\n')
+    mesh = meshio.readMesh('ply', path)
+    assert list(mesh.faceIndices) == [2, 1, 0]
+    assert list(mesh.uvs) == [1, 1, 1, 0, 0, 0]
+
+def test_mesh_missing_vertex(tmp_path):
+    path = str(tmp_path / 'frame_0001.obj')
+    writeOBJ(path, COORDS, TRIS + [(0, 1, 4)])
+    assert meshio.readMesh('obj', path) is None
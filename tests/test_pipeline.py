@@ -0,0 +1,83 @@
+import os
+import struct
+import pytest
+from import_obj_shapekey import pipeline
+from import_obj_shapekey.cache import FrameCache
+
+
+def writeFrames(directory, numFrames, numVerts=4):
+    files = []
+    for i in range(numFrames):
+        path = os.path.join(directory, 'frame_%03d.obj' % (i+1))
+        with open(path, 'w') as f:
+            for v in range(numVerts):
+                f.write('v %d %d %d\n' % (i, v, 1))
+        files.append(path)
+    return files
+
+def test_topology_runs():
+    assert pipeline.topologyRuns([4, 4, 4]) == [(0, 3)]
+    assert pipeline.topologyRuns([4, 4, 5, 5, 4]) == [(0, 2), (2, 4), (4, 5)]
+    #unknown counts go with the run before them
+    assert pipeline.topologyRuns([None, 4, None, 5]) == [(0, 3), (3, 4)]
+    assert pipeline.topologyRuns([]) == [(0, 0)]
+
+def test_budget_in_flight():
+    assert pipeline.budgetInFlight(0, 100, 4, 8) == (4, 8)
+    assert pipeline.budgetInFlight(1000, 300, 8, 0) == (3, 3)
+    #at least one frame is always read
+    assert pipeline.budgetInFlight(100, 300, 8, 0) == (1, 1)
+    assert pipeline.budgetInFlight(10**9, 300, 4, 6) == (4, 6)
+
+@pytest.mark.parametrize('numWorkers', [1, 2])
+def test_read_frames_in_order(tmp_path, numWorkers):
+    files = writeFrames(str(tmp_path), 5)
+    frames = list(pipeline.readFrames('obj', files, None, numWorkers, 2))
+    assert [f for f, coords in frames] == files
+    assert [coords[0] for f, coords in frames] == [0, 1, 2, 3, 4]
+
+def writeBrokenPLY(path, problem):
+    """ Binary PLY with a vertex layout that isn't just xyz, truncated or with an unknown property type
+    """
+    propType = 'half' if problem == 'type' else 'float'
+    with open(path, 'wb') as f:
+        f.write(("ply\nformat binary_little_endian 1.0\nelement vertex 4\nproperty float x\nproperty float y\n"
+                 "property float z\nproperty %s w\nend_header\n" % propType).encode('ascii'))
+        #one and a half vertices
+        f.write(struct.pack('<6f', 1.0, 2.0, 3.0, 4.0, 5.0, 6.0))
+        if problem == 'type':
+            f.write(b'\0'*48)
+
+@pytest.mark.parametrize('numWorkers', [1, 2])
+@pytest.mark.parametrize('problem', ['truncated_obj', 'truncated_ply', 'type'])
+def test_broken_file_falls_back(tmp_path, numWorkers, problem):
+    files = writeFrames(str(tmp_path), 2)
+    if problem == 'truncated_obj':
+        with open(files[1], 'a') as f:
+            #truncated in the middle of a line
+            f.write('v 1 2\n')
+        fileType = 'obj'
+    else:
+        files = [os.path.join(str(tmp_path), 'frame_%d.ply' % i) for i in range(2)]
+        writeBrokenPLY(files[0], problem)
+        writeBrokenPLY(files[1], problem)
+        fileType = 'ply'
+    frames = dict(pipeline.readFrames(fileType, files, None, numWorkers))
+    if problem == 'truncated_obj':
+        assert frames[files[0]] is not None
+    assert frames[files[1]] is None
+
+@pytest.mark.parametrize('numWorkers', [1, 2])
+def test_read_frames_cache(tmp_path, numWorkers):
+    files = writeFrames(str(tmp_path), 4)
+    cache = FrameCache(str(tmp_path / 'cache'), 1 << 20)
+    first = list(pipeline.readFrames('obj', files, None, numWorkers, 0, cache, 'sig'))
+    assert len(cache.entries()) == 4
+    assert cache.get(files[2], 'sig') == first[2][1]
+    assert cache.get(files[2], 'other') is None
+    second = list(pipeline.readFrames('obj', files, None, numWorkers, 0, cache, 'sig'))
+    assert second == first
+
+def test_read_vertex_counts(tmp_path):
+    files = writeFrames(str(tmp_path), 3)
+    assert pipeline.readVertexCounts('obj', files, 2) == [4, 4, 4]
@@ -0,0 +1,43 @@
+import os
+from import_obj_shapekey.scan import frameKey, scanSequence, SequenceIndex
+
+
+def touch(directory, names):
+    for name in names:
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(name)
+
+def test_frame_order(tmp_path):
+    touch(str(tmp_path), ['cloth_10.obj', 'cloth_9.obj', 'cloth_100.obj', 'other_1.obj', '.cloth_1.obj', 'cloth_1.ply'])
+    names = [os.path.basename(e[0]) for e in scanSequence(str(tmp_path), 'cloth_', 'obj')]
+    assert names == ['cloth_9.obj', 'cloth_10.obj', 'cloth_100.obj']
+
+def test_shared_frame_number_natural_order():
+    names = ['sim_f%d_lod2.obj' % i for i in (10, 11, 1, 2)]
+    assert sorted(names, key=frameKey) == ['sim_f1_lod2.obj', 'sim_f2_lod2.obj', 'sim_f10_lod2.obj', 'sim_f11_lod2.obj']
+
+def test_index_round_trip_pattern(tmp_path):
+    touch(str(tmp_path), ['cloth_%04d.obj' % i for i in range(1, 6)])
+    index = SequenceIndex.fromScan(str(tmp_path), scanSequence(str(tmp_path), 'cloth_', 'obj'))
+    assert index.pattern == 'cloth_%04d.obj'
+    unpacked = SequenceIndex.unpack(str(tmp_path), *index.pack())
+    assert unpacked.paths() == index.paths()
+    assert [unpacked.stamp(i) for i in range(len(unpacked))] == [index.stamp(i) for i in range(len(index))]
+
+def test_index_round_trip_names(tmp_path):
+    names = ['a.obj', 'b_2.obj', 'c_10%.obj']
+    touch(str(tmp_path), names)
+    index = SequenceIndex.fromScan(str(tmp_path), scanSequence(str(tmp_path), '', 'obj'))
+    assert index.pattern is None
+    unpacked = SequenceIndex.unpack(str(tmp_path), *index.pack())
+    assert unpacked.paths(False) == index.paths(False)
+
+def test_index_append_breaks_pattern(tmp_path):
+    touch(str(tmp_path), ['f_1.obj', 'f_2.obj'])
+    index = SequenceIndex.fromScan(str(tmp_path), scanSequence(str(tmp_path), 'f_', 'obj'))
+    index.append(os.path.join(str(tmp_path), 'f_3.obj'), 5, 6)
+    assert index.pattern is not None
+    index.append(os.path.join(str(tmp_path), 'f_x4.obj'), 7, 8)
+    assert index.pattern is None
+    assert index.paths(False) == ['f_1.obj', 'f_2.obj', 'f_3.obj', 'f_x4.obj']
+    assert index.stamp(3) == (7, 8)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from import_obj_shapekey.framestore import FrameStoreWriter, FrameStore
+from import_obj_shapekey.pointcache import PointCache, writePointCache
+
+
+def makeFrames(numFrames, numVerts):
+    base = np.arange(3*numVerts, dtype=np.float32)
+    frames = []
+    for i in range(numFrames):
+        frame = base.copy()
+        #only the first vertex moves
+        frame[:3] += i+1
+        frames.append(frame)
+    return base, frames
+
+@pytest.mark.parametrize('sparse', [False, True])
+def test_frame_store_round_trip(tmp_path, sparse):
+    path = str(tmp_path / 'seq.objsk')
+    base, frames = makeFrames(3, 5)
+    writer = FrameStoreWriter(path, base, 1e-6, sparse=sparse)
+    for frame in frames:
+        writer.add(frame)
+    stored = writer.close()
+    assert stored == (1 if sparse else 5)
+    store = FrameStore(path)
+    assert store.numFrames == 3
+    for i, frame in enumerate(frames):
+        assert np.array_equal(store.positions(i, base.reshape(-1, 3)), frame)
+    store.close()
+
+def test_frame_store_abort(tmp_path):
+    path = tmp_path / 'seq.objsk'
+    writer = FrameStoreWriter(str(path), np.zeros(3, dtype=np.float32))
+    writer.abort()
+    assert list(tmp_path.iterdir()) == []
+
+@pytest.mark.parametrize('ext', ['pc2', 'mdd'])
+def test_point_cache_round_trip(tmp_path, ext):
+    path = str(tmp_path / ('seq.' + ext))
+    base, frames = makeFrames(4, 6)
+    writePointCache(path, iter(frames), 6, 4, fps=30.0)
+    cache = PointCache(path)
+    assert (cache.numVerts, cache.numFrames) == (6, 4)
+    for i, frame in enumerate(frames):
+        coords = cache.positions(i)
+        assert coords.dtype == np.float32
+        assert np.array_equal(coords, frame)
+    skipped = PointCache(path, skip=1)
+    assert skipped.numFrames == 3
+    assert np.array_equal(skipped.positions(0), frames[1])
+    cache.close()
+    skipped.close()
+
+def test_point_cache_frame_count_mismatch(tmp_path):
+    path = tmp_path / 'seq.pc2'
+    base, frames = makeFrames(2, 3)
+    with pytest.raises(ValueError):
+        writePointCache(str(path), iter(frames), 3, 3)
+    #nothing is left behind
+    assert list(tmp_path.iterdir()) == []
+
+def test_point_cache_truncated(tmp_path):
+    path = str(tmp_path / 'seq.pc2')
+    base, frames = makeFrames(2, 3)
+    writePointCache(path, iter(frames), 3, 2)
+    with open(path, 'r+b') as f:
+        f.truncate(40)
+    with pytest.raises(ValueError):
+        PointCache(path)
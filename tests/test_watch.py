@@ -0,0 +1,85 @@
+import os
+import struct
+import time
+from import_obj_shapekey.scan import frameKey
+from import_obj_shapekey.watch import FolderWatcher
+
+
+def writeFrame(directory, number, numVerts=2):
+    path = os.path.join(directory, 'frame_%03d.obj' % number)
+    with open(path, 'w') as f:
+        for v in range(numVerts):
+            f.write('v %d %d 0\n' % (number, v))
+    return path
+
+def collect(watcher, count, timeout=5.0):
+    """ Poll until count frames were parsed
+    """
+    frames = []
+    end = time.time() + timeout
+    while len(frames) < count and time.time() < end:
+        watcher.poll()
+        frames += watcher.results()
+        time.sleep(0.01)
+    return frames
+
+def test_queues_stable_files_in_order(tmp_path):
+    directory = str(tmp_path)
+    known = [writeFrame(directory, 1)]
+    watcher = FolderWatcher(directory, 'frame_', 'obj', known, frameKey)
+    try:
+        files = [writeFrame(directory, i) for i in (3, 2, 4)]
+        #the first poll only records the sizes
+        watcher.poll()
+        assert watcher.todo.empty()
+        frames = collect(watcher, 3)
+        assert [f for f, coords in frames] == sorted(files)
+        assert [coords[0] for f, coords in frames] == [2, 3, 4]
+        watcher.poll()
+        assert watcher.results() == []
+    finally:
+        watcher.stop()
+
+def test_broken_file_is_retried(tmp_path):
+    directory = str(tmp_path)
+    watcher = FolderWatcher(directory, 'frame_', 'ply', [], frameKey)
+    try:
+        #a binary PLY cut off in the middle of a vertex
+        path = os.path.join(directory, 'frame_001.ply')
+        header = 'ply\nformat binary_little_endian 1.0\nelement vertex 2\n'
+        header += ''.join('property float %s\n' % a for a in 'xyzw') + 'end_header\n'
+        with open(path, 'wb') as f:
+            f.write(header.encode())
+            f.write(struct.pack('<6f', 1, 2, 3, 4, 5, 6))
+        assert collect(watcher, 1, timeout=0.5) == []
+        assert path not in watcher.known
+        assert watcher.thread.is_alive()
+        #not read again while the file stays the same
+        watcher.poll()
+        watcher.poll()
+        assert watcher.todo.empty()
+        with open(path, 'ab') as f:
+            f.write(struct.pack('<2f', 7, 8))
+        frames = collect(watcher, 1)
+        assert [f for f, coords in frames] == [path]
+        assert list(frames[0][1]) == [1, 2, 3, 5, 6, 7]
+    finally:
+        watcher.stop()
+
+def test_retry(tmp_path):
+    directory = str(tmp_path)
+    watcher = FolderWatcher(directory, 'frame_', 'obj', [], frameKey)
+    try:
+        files = [writeFrame(directory, 1), writeFrame(directory, 2)]
+        frames = collect(watcher, 2)
+        assert [f for f, coords in frames] == files
+        #the first one has to wait for its file to change, the next one comes after it
+        watcher.retry(files[0])
+        watcher.retry(files[1], changed=False)
+        assert collect(watcher, 1, timeout=0.5) == [(files[1], frames[1][1])]
+        writeFrame(directory, 1, numVerts=3)
+        frames = collect(watcher, 1)
+        assert [f for f, coords in frames] == [files[0]]
+        assert len(frames[0][1]) == 9
+    finally:
+        watcher.stop()
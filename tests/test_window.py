@@ -0,0 +1,90 @@
+import os
+import struct
+import time
+from import_obj_shapekey.window import FrameWindow
+
+PLY_HEADER = "ply\nformat ascii 1.0\nelement vertex 2\nproperty %s x\nproperty float y\nproperty float z\nend_header\n"
+
+
+def writeFrames(directory, numFrames):
+    files = []
+    for i in range(numFrames):
+        path = os.path.join(directory, 'frame_%03d.ply' % (i+1))
+        with open(path, 'w') as f:
+            f.write(PLY_HEADER % 'float')
+            f.write('%d 0 0\n0 %d 0\n' % (i, i))
+        files.append(path)
+    return files
+
+def waitFor(window, indices, timeout=5.0):
+    """ Let the read ahead thread finish, collecting what it read
+    """
+    end = time.time() + timeout
+    while time.time() < end:
+        window.collect()
+        if all(i in window.frames for i in indices):
+            return True
+        time.sleep(0.01)
+    return False
+
+def test_positions(tmp_path):
+    files = writeFrames(str(tmp_path), 5)
+    window = FrameWindow(files, 'ply', size=4, readAhead=0)
+    try:
+        assert window.numFrames == 5
+        assert list(window.positions(3)) == [3, 0, 0, 0, 3, 0]
+        assert list(window.positions(0)) == [0, 0, 0, 0, 0, 0]
+    finally:
+        window.close()
+
+def test_read_ahead_and_bounded_window(tmp_path):
+    files = writeFrames(str(tmp_path), 20)
+    window = FrameWindow(files, 'ply', size=4, readAhead=2)
+    try:
+        window.positions(0)
+        assert waitFor(window, [1, 2])
+        for i in range(20):
+            window.positions(i)
+            window.collect()
+            assert len(window.frames) <= 4
+        #playing backwards reads ahead backwards
+        window.positions(10)
+        window.positions(9)
+        assert waitFor(window, [8, 7])
+    finally:
+        window.close()
+
+def test_broken_frame(tmp_path):
+    files = writeFrames(str(tmp_path), 6)
+    #a property type the reader doesn't know, and a truncated binary file
+    binaryHeader = PLY_HEADER.replace('ascii', 'binary_little_endian')
+    with open(files[1], 'wb') as f:
+        f.write((binaryHeader % 'half').encode())
+        f.write(struct.pack('<6f', 1, 2, 3, 4, 5, 6))
+    with open(files[2], 'wb') as f:
+        f.write((binaryHeader % 'float').replace('end_header', 'property float w\nend_header').encode())
+        f.write(struct.pack('<6f', 1, 2, 3, 4, 5, 6))
+    window = FrameWindow(files, 'ply', size=8, readAhead=3)
+    try:
+        #the read ahead thread gets the broken frames and carries on
+        window.positions(0)
+        assert waitFor(window, [1, 2, 3])
+        assert window.frames[1] is None
+        assert window.frames[2] is None
+        assert window.positions(2) is None
+        window.positions(3)
+        assert waitFor(window, [4, 5])
+        assert window.thread.is_alive()
+    finally:
+        window.close()
+
+def test_meshes(tmp_path):
+    files = writeFrames(str(tmp_path), 3)
+    with open(files[1], 'wb') as f:
+        f.write(b'ply\nformat binary_little_endian 1.0\nelement vertex 2\nproperty half x\nend_header\n')
+    window = FrameWindow(files, 'ply', size=2, readAhead=1, meshes=True)
+    try:
+        assert list(window.positions(2).coords) == [2, 0, 0, 0, 2, 0]
+        assert window.positions(1) is None
+    finally:
+        window.close()